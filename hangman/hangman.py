@@ -1,16 +1,35 @@
+import argparse
+import os
 import random
 import string
-from collections import Counter
 
-from words import words
+from evil import EvilHangman
+from solver import HangmanSolver
+from sources import DIFFICULTIES, WordFilter, WordSource
+from wordpack import DEFAULT_PATH, WordPack
 
-def load_words():
+def load_words(source=None):
     """
-    Select a word from an imported list.
+    Select a random secret word.
+
+    Picks from the given word source if there is one. Otherwise picks
+    straight from the memory-mapped word pack when it has been built
+    (``python hangman/wordpack.py build``), and falls back to the list in
+    ``words.py``.
+
+    Args:
+        source (WordSource, optional): External word files to pick from
 
     Returns:
         str: The randomly chosen secret word.
     """
+    if source is not None:
+        return source.pick()
+    if os.path.exists(DEFAULT_PATH):
+        with WordPack(DEFAULT_PATH) as pack:
+            return pack.random_word()
+
+    from words import words # Only imported when there is no pack
     return random.choice(words)
 
 def display_words(word, guessed_letters):
@@ -26,6 +45,95 @@ def display_words(word, guessed_letters):
     """
     return " ".join(letter if letter in guessed_letters else "_" for letter in word)
 
+class HangmanState:
+    """
+    The state of one game, updated in place as letters are guessed.
+
+    A guess only touches the positions of that letter, and the masked word
+    is kept in a buffer instead of being rebuilt from the whole word every
+    turn, so many games can be hosted at once cheaply.
+
+    Attributes:
+        word (str): The secret word, lowercased
+        attempts (int): Wrong guesses left
+        guessed (set): Letters guessed so far
+    """
+
+    __slots__ = ('word', 'attempts', 'guessed', '_positions', '_reveal',
+                 '_remaining', '_masked')
+
+    def __init__(self, word, attempts=6):
+        """
+        Start a game.
+
+        Characters that cannot be guessed (e.g. hyphens) are shown from the
+        start.
+
+        Args:
+            word (str): The secret word
+            attempts (int): Wrong guesses allowed (default 6)
+        """
+        self.word = word.lower()
+        self.attempts = attempts
+        self.guessed = set()
+        self._positions = {} # Letter -> positions where it appears
+        self._reveal = [] # The masked word, one entry per character
+        for pos, char in enumerate(self.word):
+            if char in string.ascii_lowercase:
+                self._positions.setdefault(char, []).append(pos)
+                self._reveal.append("_")
+            else:
+                self._reveal.append(char)
+        self._remaining = len(self._positions) # Unique letters not found yet
+        self._masked = " ".join(self._reveal)
+
+    def guess(self, letter):
+        """
+        Apply a guess.
+
+        A letter that was already guessed changes nothing and costs no
+        attempt.
+
+        Args:
+            letter (str): A lowercase letter
+
+        Returns:
+            int: Number of positions revealed (0 for a wrong or repeated
+                 guess)
+        """
+        if letter in self.guessed:
+            return 0
+        self.guessed.add(letter)
+        positions = self._positions.get(letter)
+        if positions is None:
+            self.attempts -= 1
+            return 0
+
+        for pos in positions:
+            self._reveal[pos] = letter
+        self._remaining -= 1
+        self._masked = None  # Joined again on the next masked() call
+        return len(positions)
+
+    def masked(self):
+        """
+        Return the word with underscores for letters not guessed yet.
+
+        Returns:
+            str: The same format as ``display_words``
+        """
+        if self._masked is None:
+            self._masked = " ".join(self._reveal)
+        return self._masked
+
+    def is_won(self):
+        """Return True once every letter has been guessed."""
+        return self._remaining == 0
+
+    def is_lost(self):
+        """Return True once no attempts are left."""
+        return self.attempts <= 0
+
 def get_valid_guess(guessed_letters):
     """
     Prompt for a valid guess that is a single, new, and enlgish alphabetical character.
@@ -42,31 +150,95 @@ def get_valid_guess(guessed_letters):
             return guess
         print("Invalid input. Enter a single new letter")
     
-def hangman():
-    word = load_words() # Select a secret word
-    guessed_letters = set() # Track guess word
-    word_counter = Counter(word) # Count letters in word
-    attempts = 6 # Allowed wrong attempts
+def hangman(source=None):
+    word = load_words(source) # Select a secret word
+    state = HangmanState(word) # Allows 6 wrong attempts
 
     print("Welcome to Hangman!")
 
-    while attempts > 0:
-        print("\nWord:", display_words(word, guessed_letters))
-        print(f"Attempts left: {attempts}")
+    while not state.is_lost():
+        print("\nWord:", state.masked())
+        print(f"Attempts left: {state.attempts}")
 
-        guess = get_valid_guess(guessed_letters)
-        guessed_letters.add(guess)
+        guess = get_valid_guess(state.guessed)
 
-        if guess in word_counter:
+        if state.guess(guess):
             print("Good guess!")
-            word_counter.subtract(guess)
-            if all(count <= 0 for count in word_counter.values()):
+            if state.is_won():
                 print("\nCongratulations! The word was:", word)
                 return
         else:
-            attempts -= 1
             print("Wrong Guess!")
     print("\nGame Over! The word was:", word)
 
+def evil_hangman(source=None):
+    """
+    Play against a computer that keeps changing its word to dodge guesses.
+
+    Args:
+        source (WordSource, optional): External word files to play with
+    """
+    if source is not None:
+        vocabulary = list(source.words())
+    elif os.path.exists(DEFAULT_PATH):
+        with WordPack(DEFAULT_PATH) as pack:
+            vocabulary = list(pack)
+    else:
+        from words import words as vocabulary
+    letters = set(string.ascii_lowercase)
+    vocabulary = [word.lower() for word in vocabulary
+                  if letters.issuperset(word.lower())]
+    if not vocabulary:
+        print("No words to play with.")
+        return
+
+    # Pick the length like a normal game would, then stay undecided
+    game = EvilHangman(HangmanSolver(vocabulary),
+                       len(random.choice(vocabulary)))
+    attempts = 6 # Allowed wrong attempts
+
+    print("Welcome to Evil Hangman!")
+
+    while attempts > 0:
+        print("\nWord:", game.masked())
+        print(f"Attempts left: {attempts}")
+
+        guess = get_valid_guess(game.guessed)
+        if game.guess(guess):
+            print("Good guess!")
+            if game.is_solved():
+                print("\nCongratulations! The word was:", game.word())
+                return
+        else:
+            attempts -= 1
+            print("Wrong Guess!")
+    print("\nGame Over! The word was:", game.word())
+
+def main():
+    """Parse the command line and play one game."""
+    parser = argparse.ArgumentParser(description="Play Hangman.")
+    parser.add_argument("files", nargs="*",
+                        help="word files, one word per line (may be gzipped)")
+    parser.add_argument("--min-length", type=int, default=1)
+    parser.add_argument("--max-length", type=int)
+    parser.add_argument("--difficulty", choices=DIFFICULTIES)
+    parser.add_argument("--alphabet", default=string.ascii_lowercase,
+                        help="characters a word may contain")
+    parser.add_argument("--cache", metavar="DIR",
+                        help="cache filtered word lists here for O(1) picks")
+    parser.add_argument("--evil", action="store_true",
+                        help="the computer avoids committing to a word")
+    args = parser.parse_args()
+
+    source = None
+    if args.files:
+        word_filter = WordFilter(args.min_length, args.max_length,
+                                 args.difficulty, args.alphabet)
+        source = WordSource(args.files, word_filter, args.cache)
+    if args.evil:
+        evil_hangman(source)
+    else:
+        hangman(source)
+
 if __name__ == "__main__":
-    hangman()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,283 @@
+"""
+Hangman Solver
+
+Guesses letters for a hidden word from the pattern revealed so far and the
+wrong letters. The dictionary is indexed once, by word length: within each
+length, word i is bit i of a Python integer, and for every position and
+letter there is a bitset of the words with that letter there. Narrowing the
+candidates on each turn is then a few bitwise ANDs instead of a scan over
+thousands of strings.
+
+Each unguessed letter splits the candidates into families by the positions
+where it would appear (including "nowhere"). The solver picks the letter
+whose split has the highest entropy, i.e. the one that is expected to tell
+it the most about the word. The families are found by splitting bitsets
+position by position, so they are never built as strings.
+
+Usage:
+    $ python hangman/solver.py [n_words]
+"""
+
+import math
+import random
+import string
+import sys
+import time
+
+HIDDEN = "_"
+
+
+class LengthIndex:
+    """
+    Bitset index of the dictionary words of one length.
+
+    Attributes:
+        words (list): The words; word i is bit i of every bitset
+        all (int): Bitset of every word
+        at (list): at[pos] maps a letter to the bitset of the words with
+                   that letter at position pos
+        contains (dict): Maps a letter to the bitset of the words that
+                         contain it anywhere
+    """
+
+    __slots__ = ('words', 'all', 'at', 'contains')
+
+    def __init__(self, words):
+        """
+        Build the index.
+
+        Args:
+            words (list): Words that all have the same length
+        """
+        self.words = words
+        self.all = (1 << len(words)) - 1
+        length = len(words[0]) if words else 0
+        self.at = [{} for _ in range(length)]
+        self.contains = {}
+        for i, word in enumerate(words):
+            bit = 1 << i
+            for pos, letter in enumerate(word):
+                self.at[pos][letter] = self.at[pos].get(letter, 0) | bit
+                self.contains[letter] = self.contains.get(letter, 0) | bit
+
+    def has_at(self, pos, letter):
+        """Return the bitset of words with a letter at a position."""
+        return self.at[pos].get(letter, 0)
+
+
+def bits_to_indices(bits):
+    """
+    List the set bits of an integer.
+
+    Args:
+        bits (int): A bitset
+
+    Returns:
+        list: Indices of the set bits, lowest first
+    """
+    indices = []
+    while bits:
+        low = bits & -bits
+        indices.append(low.bit_length() - 1)
+        bits ^= low
+    return indices
+
+
+class HangmanSolver:
+    """
+    Chooses hangman guesses using a bitset index of a dictionary.
+
+    Attributes:
+        indexes (dict): Maps word lengths to their LengthIndex
+    """
+
+    def __init__(self, vocabulary=None):
+        """
+        Index a dictionary.
+
+        Args:
+            vocabulary (iterable, optional): Words to index; defaults to the
+                                             list in ``words.py``
+        """
+        if vocabulary is None:
+            # Imported here so that importing the solver (e.g. from
+            # hangman.py, which may read words.bin) does not load the list
+            from words import words as vocabulary
+        by_length = {}
+        for word in dict.fromkeys(word.lower() for word in vocabulary):
+            by_length.setdefault(len(word), []).append(word)
+        self.indexes = {length: LengthIndex(group)
+                        for length, group in by_length.items()}
+
+    def candidates(self, pattern, wrong_letters=()):
+        """
+        Find the words that fit what has been revealed.
+
+        Args:
+            pattern (str): The word with '_' for every hidden letter
+            wrong_letters (iterable): Guessed letters not in the word
+
+        Returns:
+            tuple: (LengthIndex, bitset of candidate words); the index is
+                   None if no word has this length
+        """
+        index = self.indexes.get(len(pattern))
+        if index is None:
+            return None, 0
+
+        bits = index.all
+        for letter in wrong_letters:
+            bits &= ~index.contains.get(letter, 0)
+
+        # A hidden position cannot hold a letter that is already revealed,
+        # since a correct guess reveals every occurrence
+        revealed = set(pattern) - {HIDDEN}
+        for pos, char in enumerate(pattern):
+            if char == HIDDEN:
+                for letter in revealed:
+                    bits &= ~index.has_at(pos, letter)
+            else:
+                bits &= index.has_at(pos, char)
+            if not bits:
+                break
+        return index, bits
+
+    def candidate_words(self, pattern, wrong_letters=()):
+        """
+        List the words that fit what has been revealed.
+
+        Args:
+            pattern (str): The word with '_' for every hidden letter
+            wrong_letters (iterable): Guessed letters not in the word
+
+        Returns:
+            list: The candidate words
+        """
+        index, bits = self.candidates(pattern, wrong_letters)
+        if index is None:
+            return []
+        return [index.words[i] for i in bits_to_indices(bits)]
+
+    @staticmethod
+    def families(index, bits, letter, hidden):
+        """
+        Split candidates by where a letter would be revealed.
+
+        Args:
+            index (LengthIndex): Index of the candidates' length
+            bits (int): Bitset of the candidates
+            letter (str): The letter being considered
+            hidden (list): Positions that are still hidden
+
+        Returns:
+            list: Sizes of the non-empty families
+        """
+        groups = [bits]
+        for pos in hidden:
+            with_letter = index.has_at(pos, letter)
+            if not with_letter & bits:
+                continue
+            split = []
+            for group in groups:
+                inside = group & with_letter
+                if inside:
+                    split.append(inside)
+                    outside = group & ~with_letter
+                    if outside:
+                        split.append(outside)
+                else:
+                    split.append(group)
+            groups = split
+        return [group.bit_count() for group in groups]
+
+    def best_guess(self, pattern, guessed):
+        """
+        Choose the letter expected to reveal the most about the word.
+
+        Args:
+            pattern (str): The word with '_' for every hidden letter
+            guessed (iterable): Every letter guessed so far
+
+        Returns:
+            str or None: The letter to guess, or None if no dictionary word
+                         fits the pattern
+        """
+        guessed = set(guessed)
+        index, bits = self.candidates(pattern, guessed - set(pattern))
+        if not bits:
+            return None
+
+        total = bits.bit_count()
+        hidden = [pos for pos, char in enumerate(pattern) if char == HIDDEN]
+        best, best_score = None, (-1.0, -1)
+        for letter in string.ascii_lowercase:
+            if letter in guessed:
+                continue
+            # Words containing the letter, to break ties between letters
+            # that split the candidates equally well
+            hits = (bits & index.contains.get(letter, 0)).bit_count()
+            if not hits:
+                continue
+            entropy = -sum(size / total * math.log2(size / total)
+                           for size in self.families(index, bits, letter,
+                                                     hidden))
+            score = (entropy, hits)
+            if score > best_score:
+                best, best_score = letter, score
+        return best
+
+
+def mask(word, guessed):
+    """Return the word with '_' for letters not guessed yet."""
+    return "".join(char if char in guessed or char not in string.ascii_lowercase
+                   else HIDDEN for char in word)
+
+
+def play(solver, word, attempts=6):
+    """
+    Let the solver play one game.
+
+    Args:
+        solver (HangmanSolver): The guesser
+        word (str): The secret word
+        attempts (int): Wrong guesses allowed (default 6)
+
+    Returns:
+        tuple: (True if the word was found, number of wrong guesses)
+    """
+    guessed = set()
+    wrong = 0
+    pattern = mask(word, guessed)
+    while HIDDEN in pattern and wrong < attempts:
+        guess = solver.best_guess(pattern, guessed)
+        guessed.add(guess)
+        if guess not in word:
+            wrong += 1
+        pattern = mask(word, guessed)
+    return HIDDEN not in pattern, wrong
+
+
+def main():
+    """Play the solver against dictionary words and print its record."""
+    n_words = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    start = time.perf_counter()
+    solver = HangmanSolver()
+    indexed = time.perf_counter() - start
+
+    secrets = random.Random(0).sample(
+        [word for index in solver.indexes.values() for word in index.words],
+        n_words)
+    start = time.perf_counter()
+    results = [play(solver, word) for word in secrets]
+    elapsed = time.perf_counter() - start
+
+    won = sum(found for found, _ in results)
+    print(f"Indexed {sum(len(i.words) for i in solver.indexes.values())} "
+          f"words in {indexed * 1000:.1f} ms")
+    print(f"Won {won}/{n_words} games ({won / n_words:.1%}), "
+          f"{sum(wrong for _, wrong in results) / n_words:.2f} wrong guesses "
+          f"per game, {elapsed / n_words * 1000:.2f} ms per game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Streaming Word Sources for Hangman
+
+Lets the game pick its secret word from external word lists (one word per
+line, optionally gzip-compressed) instead of the built-in list. Several
+files can be combined, and words can be filtered by length, difficulty
+and alphabet.
+
+Without a cache, a pick is one streaming pass over the files using
+reservoir sampling: the k-th matching word replaces the current choice with
+probability 1/k, so every matching word is equally likely and the files are
+never loaded into memory. With a cache directory, the matching words are
+written once to a word pack (see ``wordpack``) keyed by the files and the
+filter, and later picks are O(1) reads from the memory-mapped pack.
+
+Classes:
+    WordFilter: Which words are allowed
+    WordSource: One or more word files plus a filter
+"""
+
+import gzip
+import hashlib
+import os
+import random
+import string
+
+from wordpack import WordPack, build
+
+# The most frequent letters in English text; words made only of these are
+# the easiest to guess
+COMMON_LETTERS = frozenset("etaoinsrhldcu")
+DIFFICULTIES = ("easy", "medium", "hard")
+
+
+def open_words(path):
+    """
+    Open a word file as text, decompressing it if it is gzipped.
+
+    Args:
+        path (str): The file; gzip files are recognized by their content
+
+    Returns:
+        file: A text stream over the file's lines
+    """
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    if compressed:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def iter_words(paths):
+    """
+    Stream the words of one or more files.
+
+    Blank lines and lines starting with '#' are skipped, and words are
+    lowercased.
+
+    Args:
+        paths (iterable): Word files
+
+    Yields:
+        str: Each word in file order
+    """
+    for path in paths:
+        with open_words(path) as f:
+            for line in f:
+                word = line.strip().lower()
+                if word and not word.startswith("#"):
+                    yield word
+
+
+def difficulty(word):
+    """
+    Rate how hard a word is to guess.
+
+    A word is easy if all its letters are common, medium if it has one
+    uncommon letter and hard if it has more. Words of 4 letters or fewer
+    leave fewer chances to hit a letter, so they are rated one level harder.
+
+    Args:
+        word (str): A lowercase word
+
+    Returns:
+        str: 'easy', 'medium' or 'hard'
+    """
+    level = min(len(set(word) - COMMON_LETTERS), 2)
+    if len(word) <= 4:
+        level = min(level + 1, 2)
+    return DIFFICULTIES[level]
+
+
+class WordFilter:
+    """
+    Decides which words may be picked.
+
+    Attributes:
+        min_length (int): Shortest allowed word
+        max_length (int or None): Longest allowed word, None for no limit
+        difficulty (str or None): 'easy', 'medium', 'hard' or None for any
+        alphabet (frozenset): Characters a word may contain
+    """
+
+    __slots__ = ('min_length', 'max_length', 'difficulty', 'alphabet')
+
+    def __init__(self, min_length=1, max_length=None, difficulty=None,
+                 alphabet=string.ascii_lowercase):
+        """
+        Initialize the filter.
+
+        Args:
+            min_length (int): Shortest allowed word (default 1)
+            max_length (int, optional): Longest allowed word
+            difficulty (str, optional): Required difficulty
+            alphabet (str): Allowed characters (default a-z, which leaves out
+                            words with hyphens, apostrophes or accents)
+        """
+        if difficulty is not None and difficulty not in DIFFICULTIES:
+            raise ValueError(f"difficulty must be one of {DIFFICULTIES}")
+        self.min_length = min_length
+        self.max_length = max_length
+        self.difficulty = difficulty
+        self.alphabet = frozenset(alphabet)
+
+    def matches(self, word):
+        """Return True if the word passes every condition."""
+        length = len(word)
+        if length < self.min_length:
+            return False
+        if self.max_length is not None and length > self.max_length:
+            return False
+        if not self.alphabet.issuperset(word):
+            return False
+        return self.difficulty is None or difficulty(word) == self.difficulty
+
+    def key(self):
+        """Return a string that identifies the filter, for cache names."""
+        return (f"{self.min_length}:{self.max_length}:{self.difficulty}:"
+                f"{''.join(sorted(self.alphabet))}")
+
+
+def reservoir_pick(words, rng=random):
+    """
+    Pick one item uniformly at random in a single pass.
+
+    Args:
+        words (iterable): The items, of unknown number
+        rng (random.Random): Source of randomness (default the random module)
+
+    Returns:
+        The chosen item, or None if there were none
+    """
+    chosen = None
+    for seen, word in enumerate(words, 1):
+        if rng.randrange(seen) == 0:
+            chosen = word
+    return chosen
+
+
+class WordSource:
+    """
+    Picks secret words from word files.
+
+    Attributes:
+        paths (list): The word files
+        word_filter (WordFilter): Which words may be picked
+        cache_dir (str or None): Where filtered word packs are cached
+    """
+
+    def __init__(self, paths, word_filter=None, cache_dir=None):
+        """
+        Initialize the source.
+
+        Args:
+            paths (iterable): Word files, plain or gzipped
+            word_filter (WordFilter, optional): Defaults to allowing any
+                                                word of letters a-z
+            cache_dir (str, optional): Enables the index cache
+        """
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.word_filter = word_filter or WordFilter()
+        self.cache_dir = cache_dir
+
+    def words(self):
+        """
+        Stream the matching words.
+
+        Yields:
+            str: Each word that passes the filter
+        """
+        matches = self.word_filter.matches
+        return (word for word in iter_words(self.paths) if matches(word))
+
+    def index_path(self):
+        """
+        Return the cache file for these files and this filter.
+
+        The name includes each file's size and modification time, so an
+        edited file gets a new index.
+        """
+        key = [self.word_filter.key()]
+        for path in self.paths:
+            info = os.stat(path)
+            key.append(f"{path}:{info.st_size}:{info.st_mtime_ns}")
+        digest = hashlib.sha256("\n".join(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"words-{digest[:16]}.bin")
+
+    def build_index(self):
+        """
+        Write the matching words to the cache, if they are not there yet.
+
+        The words are streamed into the pack, so the files are never
+        loaded into memory here either.
+
+        Returns:
+            str: The cache file
+        """
+        path = self.index_path()
+        if not os.path.exists(path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            build(self.words(), path)
+        return path
+
+    def pick(self, rng=random):
+        """
+        Pick a matching word uniformly at random.
+
+        Args:
+            rng (random.Random): Source of randomness (default the random
+                                 module)
+
+        Returns:
+            str: The chosen word
+
+        Raises:
+            LookupError: If no word passes the filter
+        """
+        if self.cache_dir is None:
+            word = reservoir_pick(self.words(), rng)
+        else:
+            with WordPack(self.build_index()) as pack:
+                word = pack.random_word(rng) if len(pack) else None
+        if word is None:
+            raise LookupError("No word in the word files passes the filter")
+        return word
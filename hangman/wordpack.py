@@ -0,0 +1,175 @@
+"""
+Binary Word Packs for Hangman
+
+A word pack stores a vocabulary in one file that can be memory-mapped, so
+the game can pick a random word without importing ``words.py`` (which
+builds a list of every word on each start) or loading the whole list:
+
+- a header: magic, version and the number of words N;
+- N + 1 little-endian 32-bit offsets, where word i is the bytes between
+  offsets i and i + 1;
+- the UTF-8 bytes of every word, concatenated.
+
+Reading word i touches two offsets and the word itself, so a random pick
+is O(1) however large the dictionary is.
+
+Usage:
+    $ python hangman/wordpack.py build [words.txt] [output]
+"""
+
+import mmap
+import os
+import random
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+
+MAGIC = b"HMWP"
+VERSION = 1
+# magic, version, number of words
+HEADER = struct.Struct("<4sHI")
+OFFSET = struct.Struct("<2I")
+
+# Where load_words looks for the pack
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "words.bin")
+
+
+def build(vocabulary, path=DEFAULT_PATH):
+    """
+    Write a word pack.
+
+    The words are streamed to a scratch file while their offsets are
+    collected, since the offset table comes first but the number of words
+    is only known at the end; only the 4-byte offsets stay in memory. The
+    pack is written to a uniquely named file next to ``path`` and renamed
+    over it, so concurrent builds of the same file never clash.
+
+    Args:
+        vocabulary (iterable): The words, in the order they are stored
+        path (str): Destination file (default words.bin next to this module)
+
+    Returns:
+        int: Number of words written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    offsets = array("I", [0])
+    with tempfile.TemporaryFile(dir=directory) as data:
+        for word in vocabulary:
+            encoded = word.encode("utf-8")
+            data.write(encoded)
+            offsets.append(offsets[-1] + len(encoded))
+        data.seek(0)
+
+        with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp",
+                                         delete=False) as f:
+            try:
+                f.write(HEADER.pack(MAGIC, VERSION, len(offsets) - 1))
+                if sys.byteorder == "big":
+                    offsets.byteswap()  # The file is little-endian
+                offsets.tofile(f)
+                shutil.copyfileobj(data, f)
+            except BaseException:
+                f.close()
+                os.remove(f.name)
+                raise
+    os.replace(f.name, path)
+    return len(offsets) - 1
+
+
+class WordPack:
+    """
+    A memory-mapped word pack.
+
+    Supports ``len()``, indexing and iteration like a read-only list.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        """
+        Open a word pack.
+
+        Args:
+            path (str): The pack file (default words.bin next to this module)
+
+        Raises:
+            ValueError: If the file is not a word pack this version can read
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a word pack")
+        magic, version, self._count = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} word pack")
+        self._data = HEADER.size + 4 * (self._count + 1)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        """
+        Read one word.
+
+        Args:
+            i (int): Index of the word; negative indices count from the end
+
+        Returns:
+            str: The word
+        """
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        start, end = OFFSET.unpack_from(self._map, HEADER.size + 4 * i)
+        return self._map[self._data + start:self._data + end].decode("utf-8")
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def random_word(self, rng=random):
+        """
+        Pick a word uniformly at random.
+
+        Args:
+            rng (random.Random): Source of randomness (default the random
+                                 module)
+
+        Returns:
+            str: The chosen word
+        """
+        return self[rng.randrange(self._count)]
+
+    def close(self):
+        """Unmap the file."""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    """Build a word pack from a text file or from ``words.py``."""
+    if len(sys.argv) < 2 or sys.argv[1] != "build":
+        print(__doc__.split("Usage:")[1].strip())
+        return
+
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], encoding="utf-8") as f:
+            vocabulary = [line.strip() for line in f if line.strip()]
+    else:
+        from words import words as vocabulary
+    path = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_PATH
+    count = build(vocabulary, path)
+    print(f"Packed {count} words into {path} ({os.path.getsize(path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Minesweeper Benchmark Suite
+
+Times the main operations of the game across a sweep of square board
+sizes, comparing the original list-based functions with their flat-buffer
+replacements where both exist:
+
+- generation: ``create_board`` vs ``generate_counts``
+- reveal: ``flood_fill`` vs ``MinesweeperState.reveal``, on a sparser
+  board (``--flood-density``) so the click opens a large region
+- render: ``display_board`` (full frame) and a differential redraw after
+  that reveal, both written to a null sink
+- input: ``parse_coordinates`` over a batch of random coordinates
+- solve: ``solver.solve`` from a safe first click (small boards only)
+- no_guess: ``NoGuessGenerator.generate`` called back-to-back on one
+  generator, as a lobby would (small boards only), so work left over from
+  one board shows up in the time of the next
+
+Every run is seeded, so the same arguments always time the same boards.
+Each benchmark reports the best wall time over ``--repeat`` runs and the
+peak memory allocated during one extra run under ``tracemalloc`` (kept
+separate because tracing slows the code down). The results are printed as
+a table and written as JSON so they can be compared between releases.
+
+The loop-based ``create_board`` is skipped above ``--legacy-limit`` cells
+per side because it takes minutes there, the solver above
+``--solve-limit`` and no-guess generation above ``--no-guess-limit``.
+
+Usage:
+    $ python minesweeper/benchmark.py [--sizes 5 100 2000] [--output FILE]
+"""
+
+import argparse
+import contextlib
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from coordinates import column_name
+from generation import counts_to_board, generate_counts, np, safe_zone
+from minesweeper import create_board, display_board, flood_fill, parse_coordinates
+from no_guess import NoGuessGenerator
+from render import DiffRenderer
+from solver import solve
+from state import MinesweeperState
+
+PARSE_BATCH = 10_000
+NO_GUESS_BOARDS = 5
+
+
+def time_call(func, *args):
+    """
+    Time one call.
+
+    Returns:
+        float: Elapsed seconds
+    """
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def measure(setup, run, repeat=3):
+    """
+    Time a benchmark and measure its peak memory.
+
+    Args:
+        setup (callable): Returns the arguments for ``run``; not timed, and
+                          called again before every run so runs that
+                          modify their input start from the same state
+        run (callable): The code being measured
+        repeat (int): Timed runs; the fastest is reported (default 3)
+
+    Returns:
+        dict: {"seconds": best wall time, "peak_bytes": peak allocation}
+    """
+    seconds = min(time_call(run, *setup()) for _ in range(repeat))
+
+    args = setup()
+    tracemalloc.start()
+    try:
+        run(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": seconds, "peak_bytes": peak}
+
+
+class NullSink:
+    """A text stream that discards everything written to it."""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def benchmarks(size, mines, seed, args, generator):
+    """
+    Build the benchmarks for one board size.
+
+    Args:
+        size (int): Width and height of the board
+        mines (int): Number of mines
+        seed (int): Seed for the boards and inputs
+        args (argparse.Namespace): Command line options
+        generator (NoGuessGenerator): Shared by every no-guess run
+
+    Returns:
+        dict: Maps benchmark names to (setup, run) pairs
+    """
+    sparse = generate_counts(size, size, int(size * size * args.flood_density),
+                             seed)
+    board = counts_to_board(sparse, size, size)
+    # Click the first empty cell so both floods open the same region
+    start = max(sparse.find(0), 0)
+    x, y = start % size, start // size
+
+    def fresh_state():
+        return MinesweeperState(size, size, bytearray(sparse), seed)
+
+    def seeded():
+        random.seed(seed)
+        return size, size, mines
+
+    def revealed_grid():
+        return board, [[False] * size for _ in range(size)], x, y, size, size
+
+    def rendered_state():
+        state = fresh_state()
+        state.reveal(x, y)
+        return (state,)
+
+    def drawn_then_revealed():
+        state = fresh_state()
+        renderer = DiffRenderer(stream=NullSink())
+        renderer.draw(state)
+        return state, state.reveal(x, y), renderer
+
+    def full_draw(state):
+        with contextlib.redirect_stdout(NullSink()):
+            display_board(state)
+
+    def coordinates():
+        rng = random.Random(seed)
+        return ([f"{column_name(rng.randrange(size))}{rng.randrange(size) + 1}"
+                 for _ in range(PARSE_BATCH)],)
+
+    def parse_all(moves):
+        for move in moves:
+            parse_coordinates(move, size, size)
+
+    def solvable():
+        excluded = safe_zone(size, size, size // 2, size // 2)
+        return (MinesweeperState(size, size, generate_counts(
+            size, size, mines, seed, excluded)), size // 2, size // 2)
+
+    def no_guess_boards():
+        for i in range(NO_GUESS_BOARDS):
+            generator.generate(size, size, mines, size // 2, size // 2,
+                               seed + i)
+
+    cases = {}
+    if size <= args.legacy_limit:
+        cases["create_board"] = (seeded, create_board)
+    cases["generate_counts"] = (lambda: (size, size, mines, seed),
+                                generate_counts)
+    cases["flood_fill"] = (revealed_grid, flood_fill)
+    cases["reveal"] = (lambda: (fresh_state(), x, y),
+                       lambda state, x, y: state.reveal(x, y))
+    cases["display_board"] = (rendered_state, full_draw)
+    cases["diff_render"] = (drawn_then_revealed,
+                            lambda state, changed, renderer:
+                                renderer.draw(state, changed))
+    cases["parse_coordinates"] = (coordinates, parse_all)
+    if size <= args.solve_limit:
+        cases["solve"] = (solvable, solve)
+    if size <= args.no_guess_limit:
+        cases["no_guess"] = (tuple, no_guess_boards)
+    return cases
+
+
+def main():
+    """Run the benchmarks, print a table and write the JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[5, 10, 50, 100, 500, 1000, 2000])
+    parser.add_argument("--density", type=float, default=0.15)
+    parser.add_argument("--flood-density", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--legacy-limit", type=int, default=500)
+    parser.add_argument("--solve-limit", type=int, default=100)
+    parser.add_argument("--no-guess-limit", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="no-guess worker processes (default CPU count)")
+    parser.add_argument("--output", default="minesweeper-benchmark.json",
+                        help="JSON results file, or - for stdout")
+    args = parser.parse_args()
+
+    results = []
+    with NoGuessGenerator(args.workers) as generator:
+        for size in args.sizes:
+            mines = int(size * size * args.density)
+            print(f"{size}x{size}, {mines} mines", file=sys.stderr)
+            timings = {}
+            for name, (setup, run) in benchmarks(size, mines, args.seed, args,
+                                                 generator).items():
+                timings[name] = measure(setup, run, args.repeat)
+                print(f"  {name:<18} "
+                      f"{timings[name]['seconds'] * 1000:>11.3f} ms "
+                      f"{timings[name]['peak_bytes'] / 1024:>12.1f} KiB",
+                      file=sys.stderr)
+            results.append({"width": size, "height": size, "mines": mines,
+                            "benchmarks": timings})
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__ if np is not None else None,
+        "seed": args.seed,
+        "density": args.density,
+        "flood_density": args.flood_density,
+        "repeat": args.repeat,
+        "parse_batch": PARSE_BATCH,
+        "no_guess_boards": NO_GUESS_BOARDS,
+        "no_guess_workers": generator.workers,
+        "results": results,
+    }
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Spreadsheet-Style Column Names for Minesweeper
+
+Columns are named A..Z, then AA..AZ, BA..ZZ, AAA and so on, so boards can
+be wider than 26 columns. Both conversions are O(length of the name).
+"""
+
+
+def column_name(index):
+    """
+    Convert a 0-based column index to its name.
+
+    Args:
+        index (int): Column index (0 is 'A', 25 is 'Z', 26 is 'AA')
+
+    Returns:
+        str: The column name
+    """
+    letters = []
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters.append(chr(65 + remainder))
+    return "".join(reversed(letters))
+
+
+def column_index(name):
+    """
+    Convert a column name to its 0-based index.
+
+    Args:
+        name (str): Column letters, in either case (e.g. 'A', 'ab')
+
+    Returns:
+        int or None: The column index, or None if the name has a character
+                     that is not a letter A-Z
+    """
+    if not name:
+        return None
+    index = 0
+    for char in name.upper():
+        if not 'A' <= char <= 'Z':
+            return None
+        index = index * 26 + ord(char) - 64
+    return index - 1
@@ -0,0 +1,115 @@
+"""
+Scanline Flood Fill for Minesweeper
+
+Reveals the open region around a clicked cell on a flat board (see
+``generation``). Instead of visiting cells one at a time, the fill works
+on horizontal spans of zero cells: each span and the numbered cells around
+it are revealed with slice assignments, and the ends of a span are found
+with ``bytes.find``/``rfind`` on a precomputed zero mask, so the Python
+work is per span rather than per cell.
+"""
+
+from generation import MINE
+
+# Maps cell values to 0 for empty (count 0) cells and 1 for everything else
+_ZERO_MASK = bytes.maketrans(bytes(range(256)), b"\x00" + b"\x01" * 255)
+
+
+def zero_mask(counts):
+    """
+    Build the mask used by ``flood_reveal``.
+
+    The mask only depends on the counts, so callers revealing many cells on
+    the same board should build it once and pass it in.
+
+    Args:
+        counts (bytearray): Flat board with counts 0-8 and MINE
+
+    Returns:
+        bytes: 0 for cells without adjacent mines, 1 for all other cells
+    """
+    return bytes(counts).translate(_ZERO_MASK)
+
+
+def flood_reveal(counts, revealed, width, height, x, y, mask=None):
+    """
+    Reveal a cell and, if it has no adjacent mines, its whole open region.
+
+    Args:
+        counts (bytearray): Flat board with counts 0-8 and MINE
+        revealed (bytearray): Flat board, 1 for revealed cells; updated
+                              in place
+        width (int): Width of the board
+        height (int): Height of the board
+        x (int): X-coordinate of the clicked cell
+        y (int): Y-coordinate of the clicked cell
+        mask (bytes, optional): Result of ``zero_mask(counts)``
+
+    Returns:
+        list: Flat indices of the newly revealed cells, so the caller can
+              redraw only those. Empty if the cell was already revealed or
+              is a mine
+    """
+    start = y * width + x
+    if revealed[start] or counts[start] == MINE:
+        return []
+    if counts[start] != 0:
+        revealed[start] = 1
+        return [start]
+
+    if mask is None:
+        mask = zero_mask(counts)
+    ones = memoryview(b"\x01" * (width + 2))
+    newly = []
+    seeds = [start]
+    expanded = set()  # Left ends of spans already processed
+
+    while seeds:
+        index = seeds.pop()
+        row, col = divmod(index, width)
+        row_start = row * width
+        row_end = row_start + width
+
+        # Extend the span of zero cells left and right of the seed
+        left = mask.rfind(1, row_start, index) + 1 or row_start
+        if left in expanded:
+            continue  # Reached again through another piece of the span
+        expanded.add(left)
+        right = mask.find(1, index, row_end)
+        if right == -1:
+            right = row_end
+
+        # The span plus one cell either side, in this row and its neighbours
+        lo = left - row_start - (left > row_start)
+        hi = right - row_start + (right < row_end)
+
+        for other in (row - 1, row, row + 1):
+            if not 0 <= other < height:
+                continue
+            begin = other * width + lo
+            end = other * width + hi
+            old = revealed[begin:end]
+
+            # Walk the runs of cells that were still hidden
+            pos = old.find(0)
+            while pos != -1:
+                stop = old.find(1, pos)
+                if stop == -1:
+                    stop = end - begin
+                newly.extend(range(begin + pos, begin + stop))
+
+                # Hidden zero cells in the rows above and below start spans
+                if other != row:
+                    zero = mask.find(0, begin + pos, begin + stop)
+                    while zero != -1:
+                        seeds.append(zero)
+                        run_end = mask.find(1, zero, begin + stop)
+                        if run_end == -1:
+                            break
+                        zero = mask.find(0, run_end, begin + stop)
+
+                pos = old.find(0, stop) if stop < end - begin else -1
+
+            revealed[begin:end] = ones[:end - begin]
+
+    return newly
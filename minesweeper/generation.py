@@ -0,0 +1,202 @@
+"""
+Fast Minesweeper Board Generation
+
+Builds boards as a flat ``bytearray`` of ``width * height`` cells, where
+cell (x, y) is at index ``y * width + x`` and holds its number of adjacent
+mines (0-8) or ``MINE``. Mines are sampled without replacement in one call
+and the neighbour counts are computed with whole-board shifted sums
+instead of a Python loop per cell:
+
+- with numpy installed, the sums run over a padded integer array;
+- without it, every cell becomes one 4-bit digit of a big Python integer,
+  so shifting and adding the integer sums all cells at once in C.
+
+Both paths are deterministic for a given seed, but they draw different
+boards from the same seed.
+"""
+
+import random
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+MINE = 9
+
+# Maps cell values to the characters used by the list-of-strings board
+_TO_CHARS = bytes.maketrans(bytes(range(10)), b"012345678M")
+# Maps hex digits of the packed-integer path back to cell values
+_FROM_HEX = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def safe_zone(width, height, x, y):
+    """
+    List a cell and its neighbours, e.g. to keep a first click mine-free.
+
+    Args:
+        width (int): Width of the board
+        height (int): Height of the board
+        x (int): X-coordinate of the cell
+        y (int): Y-coordinate of the cell
+
+    Returns:
+        list: Flat indices of the cell and the up to 8 cells around it
+    """
+    return [ny * width + nx
+            for ny in range(max(y - 1, 0), min(y + 2, height))
+            for nx in range(max(x - 1, 0), min(x + 2, width))]
+
+
+def _check_mines(width, height, num_mines, excluded):
+    """Raise ValueError if the mines do not fit outside the excluded cells."""
+    if not 0 <= num_mines <= width * height - len(excluded):
+        raise ValueError("num_mines must be between 0 and the number of "
+                         "cells that may hold a mine")
+
+
+def place_mines(width, height, num_mines, seed=None, exclude=()):
+    """
+    Choose mine positions without replacement.
+
+    Args:
+        width (int): Width of the board
+        height (int): Height of the board
+        num_mines (int): Number of mines to place
+        seed (int, optional): Seed for reproducible boards
+        exclude (iterable): Flat indices that must not hold a mine
+
+    Returns:
+        list: Flat cell indices of the mines
+    """
+    excluded = sorted(set(exclude))
+    _check_mines(width, height, num_mines, excluded)
+    mines = random.Random(seed).sample(range(width * height - len(excluded)),
+                                       num_mines)
+    if excluded:
+        # Shift each pick past the excluded cells at or below it
+        for i, index in enumerate(mines):
+            for skipped in excluded:
+                if index < skipped:
+                    break
+                index += 1
+            mines[i] = index
+    return mines
+
+
+def count_neighbours(mines, width, height):
+    """
+    Compute neighbour counts for the given mines.
+
+    Args:
+        mines (iterable): Flat cell indices of the mines
+        width (int): Width of the board
+        height (int): Height of the board
+
+    Returns:
+        bytearray: Flat board with counts 0-8 and MINE on mine cells
+    """
+    mines = list(mines)
+    if np is not None:
+        counts = _count_numpy(mines, width, height)
+    else:
+        counts = _count_packed(mines, width, height)
+
+    for index in mines:
+        counts[index] = MINE
+    return counts
+
+
+def _count_numpy(mines, width, height):
+    """Sum the 8 shifted copies of a padded mine grid with numpy."""
+    cells = np.zeros(width * height, dtype=np.uint8)
+    cells[mines] = 1
+    grid = np.zeros((height + 2, width + 2), dtype=np.uint8)
+    grid[1:-1, 1:-1] = cells.reshape(height, width)
+
+    counts = np.zeros((height, width), dtype=np.uint8)
+    for dy in (0, 1, 2):
+        for dx in (0, 1, 2):
+            if dy != 1 or dx != 1:
+                counts += grid[dy:dy + height, dx:dx + width]
+    return bytearray(counts.tobytes())
+
+
+def _count_packed(mines, width, height):
+    """
+    Sum shifted copies of the board packed into one big integer.
+
+    Cell i is hex digit i of the integer (least significant first). A count
+    never exceeds 8, so digits never carry into their neighbours.
+    """
+    size = width * height
+    if size == 0:
+        return bytearray()
+
+    digits = bytearray(b"0") * size
+    for index in mines:
+        digits[index] = ord("1")
+    board = int(digits[::-1], 16)
+
+    # Masks clearing the digits that wrap around a row edge after a shift
+    not_first = int(("f" * (width - 1) + "0") * height, 16)
+    not_last = int(("0" + "f" * (width - 1)) * height, 16)
+    full = (1 << 4 * size) - 1
+
+    # Horizontal sums: the cell itself plus its left and right neighbours
+    rows = board + (board << 4 & not_first & full) + (board >> 4 & not_last)
+    # Add the row sums from above and below, then drop the cell itself
+    row_shift = 4 * width
+    counts = rows + (rows << row_shift & full) + (rows >> row_shift) - board
+
+    hex_digits = format(counts, "x").zfill(size).encode("ascii")
+    return bytearray(hex_digits[::-1].translate(_FROM_HEX))
+
+
+def generate_counts(width, height, num_mines, seed=None, exclude=()):
+    """
+    Generate a random board.
+
+    Args:
+        width (int): Width of the board
+        height (int): Height of the board
+        num_mines (int): Number of mines to place
+        seed (int, optional): Seed for reproducible boards
+        exclude (iterable): Flat indices that must not hold a mine, e.g.
+                            ``safe_zone`` around the first click
+
+    Returns:
+        bytearray: Flat board with counts 0-8 and MINE on mine cells
+    """
+    if np is not None:
+        excluded = sorted(set(exclude))
+        _check_mines(width, height, num_mines, excluded)
+        rng = np.random.default_rng(seed)
+        mines = rng.choice(width * height - len(excluded), size=num_mines,
+                           replace=False)
+        for skipped in excluded:
+            mines += mines >= skipped
+        return count_neighbours(mines.tolist(), width, height)
+    return count_neighbours(
+        place_mines(width, height, num_mines, seed, exclude), width, height)
+
+
+def counts_to_board(counts, width, height):
+    """
+    Convert a flat board into the list of lists of strings of
+    ``create_board``.
+
+    The game itself works on ``MinesweeperState``; this format is only
+    needed by the legacy ``flood_fill`` and by the benchmark that compares
+    the two.
+
+    Args:
+        counts (bytearray): Flat board from ``generate_counts``
+        width (int): Width of the board
+        height (int): Height of the board
+
+    Returns:
+        list: 2D list with 'M' for mines and '0'-'8' for other cells
+    """
+    chars = bytes(counts).translate(_TO_CHARS).decode("ascii")
+    return [list(chars[y * width:(y + 1) * width]) for y in range(height)]
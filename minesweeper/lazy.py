@@ -0,0 +1,300 @@
+"""
+Lazy First-Click-Safe Minesweeper Board
+
+``LazyBoard`` does no per-cell work up front. Mines are only placed when
+the first cell is revealed, outside that cell and its neighbours, so the
+first click always opens an area. Mines are kept as a set of flat indices
+and each neighbour count is computed the first time it is needed and then
+memoized, so on a huge board where the player reveals a small fraction of
+the cells, the cost is proportional to what was revealed rather than to
+``width * height``.
+
+It has the same interface as ``MinesweeperState`` (reveal, toggle_flag,
+chord, view, ...), so ``play_game`` and ``DiffRenderer`` work with either.
+"""
+
+from collections import deque
+
+from generation import MINE, count_neighbours, place_mines, safe_zone
+from solver import neighbours
+from state import DIGITS, FLAG, HIDDEN, MINE_CHAR, MinesweeperState
+
+
+class LazyBoard:
+    """
+    A Minesweeper game whose mines are placed on the first reveal.
+
+    Cell (x, y) is at flat index ``y * width + x``.
+
+    Attributes:
+        width (int): Width of the board
+        height (int): Height of the board
+        num_mines (int): Number of mines on the board
+        seed (int or None): Seed used to place the mines, if any
+        mines (set or None): Flat indices of the mines, None until the
+                             first reveal
+        revealed (set): Flat indices of revealed cells
+        flagged (set): Flat indices of flagged cells
+        flag_counts (dict): Number of flagged neighbours of each cell next
+                            to a flag, kept up to date as flags change
+        view (bytearray): The character shown for each cell
+        revealed_count (int): Number of revealed cells
+        flags_placed (int): Number of flagged cells
+        exploded (int or None): Index of the mine that was revealed
+    """
+
+    __slots__ = ('width', 'height', 'num_mines', 'seed', 'mines', 'revealed',
+                 'flagged', 'flag_counts', 'view', 'revealed_count',
+                 'flags_placed', 'exploded', '_counts')
+
+    def __init__(self, width, height, num_mines, seed=None):
+        """
+        Initialize a game with no mines placed yet.
+
+        Args:
+            width (int): Width of the board
+            height (int): Height of the board
+            num_mines (int): Number of mines to place on the first reveal
+            seed (int, optional): Seed for reproducible boards
+        """
+        if not 0 <= num_mines < width * height:
+            raise ValueError("num_mines must leave at least one safe cell")
+        self.width = width
+        self.height = height
+        self.num_mines = num_mines
+        self.seed = seed
+        self.mines = None
+        self.revealed = set()
+        self.flagged = set()
+        self.flag_counts = {}
+        self.view = bytearray([HIDDEN]) * (width * height)
+        self.revealed_count = 0
+        self.flags_placed = 0
+        self.exploded = None
+        self._counts = {}  # Memoized neighbour counts
+
+    def _place_mines(self, index):
+        """Place the mines, keeping the cell at index and its neighbours safe."""
+        width, height = self.width, self.height
+        y, x = divmod(index, width)
+        excluded = safe_zone(width, height, x, y)
+        if width * height - len(excluded) < self.num_mines:
+            excluded = [index]  # Too crowded to clear the whole neighbourhood
+        self.mines = set(place_mines(width, height, self.num_mines,
+                                     self.seed, excluded))
+
+    def count_at(self, index):
+        """
+        Return the neighbour count of a cell, computing it on first use.
+
+        Args:
+            index (int): Flat index of the cell
+
+        Returns:
+            int: 0-8, or MINE for a mine
+        """
+        count = self._counts.get(index)
+        if count is None:
+            mines = self.mines
+            if index in mines:
+                count = MINE
+            else:
+                count = sum(1 for other in neighbours(index, self.width,
+                                                      self.height)
+                            if other in mines)
+            self._counts[index] = count
+        return count
+
+    def is_mine(self, x, y):
+        """Return True if there is a mine at (x, y)."""
+        return self.mines is not None and y * self.width + x in self.mines
+
+    def is_revealed(self, x, y):
+        """Return True if the cell at (x, y) has been revealed."""
+        return y * self.width + x in self.revealed
+
+    def is_flagged(self, x, y):
+        """Return True if the cell at (x, y) is flagged."""
+        return y * self.width + x in self.flagged
+
+    def is_won(self):
+        """Return True once every safe cell has been revealed."""
+        return (self.exploded is None and
+                self.revealed_count == self.width * self.height - self.num_mines)
+
+    def reveal(self, x, y):
+        """
+        Reveal a cell, flooding its open region if it has no adjacent mines.
+
+        The first reveal places the mines. Revealing a mine sets
+        ``exploded``. Flagged cells are not revealed when clicked, but a
+        flood clears any wrong flags it reaches.
+
+        Args:
+            x (int): X-coordinate of the cell
+            y (int): Y-coordinate of the cell
+
+        Returns:
+            list: Flat indices of the newly revealed cells
+        """
+        width, height = self.width, self.height
+        index = y * width + x
+        if index in self.revealed or index in self.flagged:
+            return []
+        if self.mines is None:
+            self._place_mines(index)
+
+        mines, revealed, view = self.mines, self.revealed, self.view
+        if index in mines:
+            revealed.add(index)
+            view[index] = MINE_CHAR
+            self.exploded = index
+            return [index]
+
+        # Breadth-first flood; cells are marked revealed when queued
+        newly = [index]
+        revealed.add(index)
+        queue = deque(newly)
+        counts, flagged = self._counts, self.flagged
+        while queue:
+            cell = queue.popleft()
+            around = neighbours(cell, width, height)
+            count = counts.get(cell)
+            if count is None:
+                count = counts[cell] = sum(other in mines for other in around)
+            view[cell] = DIGITS[count]
+            if cell in flagged:
+                self._set_flag(cell, False)
+            if count == 0:
+                for other in around:
+                    if other not in revealed:
+                        revealed.add(other)
+                        newly.append(other)
+                        queue.append(other)
+
+        self.revealed_count += len(newly)
+        return newly
+
+    def _set_flag(self, index, value):
+        """Set or clear a flag and update the neighbours' flag counts."""
+        step = 1 if value else -1
+        if value:
+            self.flagged.add(index)
+        else:
+            self.flagged.discard(index)
+        self.flags_placed += step
+        flag_counts = self.flag_counts
+        for other in neighbours(index, self.width, self.height):
+            flag_counts[other] = flag_counts.get(other, 0) + step
+
+    def toggle_flag(self, x, y):
+        """
+        Flag a hidden cell, or remove its flag.
+
+        Args:
+            x (int): X-coordinate of the cell
+            y (int): Y-coordinate of the cell
+
+        Returns:
+            list: The flat index of the cell if it changed, otherwise empty
+        """
+        index = y * self.width + x
+        if index in self.revealed:
+            return []
+        flag = index not in self.flagged
+        self._set_flag(index, flag)
+        self.view[index] = FLAG if flag else HIDDEN
+        return [index]
+
+    def can_chord(self, x, y):
+        """
+        Check in O(1) whether a number has as many flags around it as mines.
+
+        Args:
+            x (int): X-coordinate of the cell
+            y (int): Y-coordinate of the cell
+
+        Returns:
+            bool: True if the cell is a revealed number that is satisfied
+        """
+        index = y * self.width + x
+        if index not in self.revealed:
+            return False
+        count = self.count_at(index)
+        return 0 < count < MINE and self.flag_counts.get(index, 0) == count
+
+    def chord(self, x, y):
+        """
+        Reveal every unflagged neighbour of a satisfied number.
+
+        If a flag is wrong, this reveals a mine and sets ``exploded``.
+
+        Args:
+            x (int): X-coordinate of a revealed number
+            y (int): Y-coordinate of a revealed number
+
+        Returns:
+            list: Flat indices of the newly revealed cells
+        """
+        if not self.can_chord(x, y):
+            return []
+        newly = []
+        width = self.width
+        for other in neighbours(y * width + x, width, self.height):
+            if other not in self.revealed and other not in self.flagged:
+                newly += self.reveal(other % width, other // width)
+        return newly
+
+    def show_mines(self):
+        """
+        Mark every unflagged mine in ``view``, for the final board.
+
+        Returns:
+            list: Flat indices of the mines
+        """
+        if self.mines is None:
+            return []
+        mines = sorted(self.mines)
+        for index in mines:
+            if index not in self.flagged:
+                self.view[index] = MINE_CHAR
+        return mines
+
+    def to_state(self):
+        """
+        Copy the game into a MinesweeperState, e.g. to save it.
+
+        Only valid once the mines have been placed.
+
+        Returns:
+            MinesweeperState: A game with the same mines, revealed cells
+                              and flags
+        """
+        width = self.width
+        counts = count_neighbours(self.mines, width, self.height)
+        state = MinesweeperState(width, self.height, counts, self.seed)
+        for index in self.revealed:
+            state.revealed[index] = 1
+        for index in self.flagged:
+            state.toggle_flag(index % width, index // width)
+        state.view[:] = self.view
+        state.revealed_count = self.revealed_count
+        state.exploded = self.exploded
+        return state
+
+    def char_at(self, x, y):
+        """Return the character currently shown for the cell at (x, y)."""
+        return chr(self.view[y * self.width + x])
+
+    def row_string(self, y):
+        """
+        Render one row of the board.
+
+        Args:
+            y (int): Row index
+
+        Returns:
+            str: The row's cell characters separated by spaces
+        """
+        start = y * self.width
+        return " ".join(self.view[start:start + self.width].decode("ascii"))
@@ -4,14 +4,44 @@ Simple Minesweeper Game
 
 A terminal-based implementation of the classic Minesweeper game
 with standard coordinate notation (A1, B2, etc.) and minimal UI.
+Columns past Z continue as AA, AB, etc., so boards can be any size.
 """
 
 import random
 import os
+import sys
+from collections import deque
+
+from coordinates import column_index
+from lazy import LazyBoard
+from render import CLEAR, DiffRenderer
+from snapshot import load, save
+from state import MinesweeperState
+
+# Where 's' saves the game in progress
+SAVE_FILE = "minesweeper.sav"
+
+# Difficulty presets as (width, height, number of mines)
+DIFFICULTIES = {
+    'classic': (5, 5, 4),
+    'beginner': (9, 9, 10),
+    'intermediate': (16, 16, 40),
+    'expert': (30, 16, 99),
+}
+
+# Offsets of the 8 cells around a cell
+NEIGHBOURS = ((-1, -1), (0, -1), (1, -1),
+              (-1, 0),           (1, 0),
+              (-1, 1),  (0, 1),  (1, 1))
 
 def clear_screen():
     """Clear the terminal screen, cross-platform."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # An escape code avoids starting a shell just to clear the screen
+        sys.stdout.write(CLEAR)
+        sys.stdout.flush()
 
 def create_board(width, height, num_mines):
     """
@@ -56,40 +86,36 @@ def create_board(width, height, num_mines):
     
     return board
 
-def display_board(board, revealed, width, height, game_over=False):
+def board_header(state):
     """
-    Display the current state of the game board.
+    Build the lines shown above the board.
     
     Args:
-        board (list): 2D list with the game board
-        revealed (list): 2D list tracking revealed cells
-        width (int): Width of the board
-        height (int): Height of the board
-        game_over (bool): Whether the game is over
+        state (MinesweeperState): The game being played
+        
+    Returns:
+        list: The title and command summary lines
     """
-    clear_screen()
+    return [
+        f"MINESWEEPER - {state.width}x{state.height} - {state.num_mines} mines",
+        "Type: A1 (reveal) | f A1 (flag) | c A1 (chord) | s (save) | "
+        "h (help) | q (quit)",
+    ]
+
+def display_board(state, game_over=False):
+    """
+    Display the current state of the game board.
     
-    print("MINESWEEPER - 5x5 - 4 mines")
-    print("Type: A1 (reveal) | h (help) | q (quit)")
+    The whole frame is built as one string and written in a single call.
     
-    # Print column headers (A, B, C, etc.)
-    print("  ", end="")
-    for x in range(width):
-        print(f"{chr(65 + x)}", end=" ")
-    print()
+    Args:
+        state (MinesweeperState): The game to draw
+        game_over (bool): Whether the game is over (shows all mines)
+    """
+    if game_over:
+        state.show_mines()
     
-    # Print rows with numbers (1, 2, 3, etc.)
-    for y in range(height):
-        print(f"{y + 1} ", end="")
-        
-        for x in range(width):
-            if game_over and board[y][x] == 'M':
-                print("M", end=" ")
-            elif revealed[y][x]:
-                print(board[y][x], end=" ")
-            else:
-                print(".", end=" ")
-        print()
+    DiffRenderer(board_header(state)).draw(state)
 
 def show_help():
     """Display help information for the game."""
@@ -97,9 +123,11 @@ def show_help():
     print("MINESWEEPER HELP")
     print("Goal: Reveal all safe cells without hitting mines")
     print("Numbers show mines in adjacent cells")
-    print("Legend: . (hidden) | 0-8 (safe) | M (mine)")
-    print("Standard notation: A1, B3, etc (column + row)")
-    print("Commands: A1 | h (help) | q (quit)")
+    print("Legend: . (hidden) | F (flag) | 0-8 (safe) | M (mine)")
+    print("Standard notation: A1, B3, AA10, etc (column + row)")
+    print("Commands: A1 (reveal) | f A1 (flag/unflag) | s (save) | h (help) | q (quit)")
+    print("Chord: c A1 on a number with all its mines flagged reveals")
+    print("       the rest of its neighbours")
     input("Press Enter to return...")
 
 def parse_coordinates(move, width, height):
@@ -107,39 +135,42 @@ def parse_coordinates(move, width, height):
     Parse user input into board coordinates.
     
     Args:
-        move (str): User input string (e.g., 'A1', 'B3')
+        move (str): User input string (e.g., 'A1', 'B3', 'AA12')
         width (int): Width of the board
         height (int): Height of the board
         
     Returns:
         tuple: (x, y) coordinates or None if invalid
     """
-    if len(move) < 2:
+    # Leading letters are the column, trailing digits the row
+    letters = move.rstrip("0123456789")
+    digits = move[len(letters):]
+    if not digits:
         return None
     
-    # First character should be a letter (column)
-    col_char = move[0].upper()
-    if not ('A' <= col_char <= chr(64 + width)):
+    x = column_index(letters)
+    if x is None or x >= width:
         return None
     
-    # Rest should be a number (row)
-    try:
-        row = int(move[1:])
-        if not (1 <= row <= height):
-            return None
-    except ValueError:
+    # Longer rows cannot be on the board, and int() refuses over 4300 digits
+    digits = digits.lstrip("0") or "0"
+    if len(digits) > len(str(height)):
+        return None
+    row = int(digits)
+    if not (1 <= row <= height):
         return None
     
     # Convert to 0-based indices
-    x = ord(col_char) - 65  # A=0, B=1, etc.
-    y = row - 1             # 1=0, 2=1, etc.
-    
-    return (x, y)
+    return (x, row - 1)
 
 def flood_fill(board, revealed, x, y, width, height):
     """
     Reveal adjacent empty cells using flood fill algorithm.
     
+    Uses a deque so each cell is dequeued in O(1). For large boards, see
+    ``floodfill.flood_reveal``, which works on flat arrays span by span and
+    reports the revealed cells.
+    
     Args:
         board (list): 2D list with the game board
         revealed (list): 2D list tracking revealed cells
@@ -154,45 +185,55 @@ def flood_fill(board, revealed, x, y, width, height):
     if revealed[y][x] or board[y][x] == 'M':
         return 0
     
-    queue = [(x, y)]
+    queue = deque([(x, y)])
     revealed[y][x] = True
     count = 1  # Count this cell
     
     while queue:
-        cx, cy = queue.pop(0)
+        cx, cy = queue.popleft()
         
         # If cell has no adjacent mines, reveal its neighbors
         if board[cy][cx] == '0':
-            for dy in [-1, 0, 1]:
-                for dx in [-1, 0, 1]:
-                    nx, ny = cx + dx, cy + dy
-                    if (0 <= nx < width and 0 <= ny < height and 
-                        not revealed[ny][nx] and board[ny][nx] != 'M'):
-                        revealed[ny][nx] = True
-                        count += 1
-                        if board[ny][nx] == '0':
-                            queue.append((nx, ny))
+            for dx, dy in NEIGHBOURS:
+                nx, ny = cx + dx, cy + dy
+                if (0 <= nx < width and 0 <= ny < height and 
+                    not revealed[ny][nx] and board[ny][nx] != 'M'):
+                    revealed[ny][nx] = True
+                    count += 1
+                    if board[ny][nx] == '0':
+                        queue.append((nx, ny))
                             
     return count
 
-def play_game():
-    """Main game loop for Minesweeper."""
-    # Game settings
-    width = 5
-    height = 5
-    num_mines = 4
+def play_game(width=5, height=5, num_mines=4, lazy=False, state=None):
+    """
+    Main game loop for Minesweeper.
     
-    # Create the game board
-    board = create_board(width, height, num_mines)
-    revealed = [[False for _ in range(width)] for _ in range(height)]
+    Args:
+        width (int): Width of the board (default 5)
+        height (int): Height of the board (default 5)
+        num_mines (int): Number of mines to place (default 4)
+        lazy (bool): Place the mines after the first click, keeping it and
+                     its neighbours safe (default False)
+        state (MinesweeperState, optional): A saved game to resume instead
+                                            of starting a new one
+    """
+    # Create the game state
+    if state is not None:
+        width, height = state.width, state.height
+    elif lazy:
+        state = LazyBoard(width, height, num_mines)
+    else:
+        state = MinesweeperState.new(width, height, num_mines)
+    renderer = DiffRenderer(board_header(state))
+    changed = None  # Cells to redraw; None redraws everything
+    message = ""
     game_over = False
     
-    total_safe_cells = width * height - num_mines
-    revealed_count = 0
-    
     # Main game loop
     while not game_over:
-        display_board(board, revealed, width, height)
+        renderer.draw(state, changed, message)
+        changed, message = [], ""
         
         # Get user input
         move = input("> ").lower().strip()
@@ -202,48 +243,100 @@ def play_game():
         
         if move == 'h':
             show_help()
+            changed = None
+            continue
+        
+        if move == 's':
+            if isinstance(state, LazyBoard):
+                if state.mines is None:
+                    message = "Nothing to save before the first move"
+                    continue
+                save(state.to_state(), SAVE_FILE)
+            else:
+                save(state, SAVE_FILE)
+            message = f"Saved to {SAVE_FILE}"
             continue
         
+        # Commands are "A1" (reveal), "f A1" (flag) and "c A1" (chord)
+        command, _, target = move.partition(" ")
+        if not target:
+            command, target = "", command
+        
         # Parse coordinates like "A1", "B3", etc.
-        coords = parse_coordinates(move, width, height)
-        if coords:
+        coords = parse_coordinates(target.strip(), width, height)
+        if coords and command in ("", "f", "c"):
             x, y = coords
             
-            if revealed[y][x]:
+            if command == "f":
+                changed = state.toggle_flag(x, y)
+                message = f"Mines left: {state.num_mines - state.flags_placed}"
                 continue
             
-            # Reveal the cell
-            revealed[y][x] = True
-            revealed_count += 1
+            if command == "c":
+                if not state.can_chord(x, y):
+                    message = "Chord needs a number with all its mines flagged"
+                    continue
+                changed = state.chord(x, y)
+            else:
+                # Reveal the cell, and its open region if it has no adjacent mines
+                changed = state.reveal(x, y)
             
             # Check if mine was hit
-            if board[y][x] == 'M':
+            if state.exploded is not None:
                 game_over = True
-                print("BOOM! Game over!")
-            else:
-                # Auto-reveal adjacent cells if the revealed cell has no adjacent mines
-                if board[y][x] == '0':
-                    # Subtract 1 since we already counted the initial cell
-                    revealed_count += flood_fill(board, revealed, x, y, width, height) - 1
-                
-                # Check for win
-                if revealed_count == total_safe_cells:
-                    game_over = True
-                    print("You win!")
-    
-    # Show final board
-    display_board(board, revealed, width, height, game_over=True)
+                message = "BOOM! Game over!"
+            elif state.is_won():
+                game_over = True
+                message = "You win!"
+    
+    # Show final board with every mine
+    changed += state.show_mines()
+    renderer.draw(state, changed, message)
     input("Game over. Press Enter to exit...")
 
+def choose_settings():
+    """
+    Ask the player for a difficulty preset or custom board.
+    
+    Returns:
+        tuple: (width, height, num_mines)
+    """
+    names = " | ".join(DIFFICULTIES)
+    while True:
+        choice = input(f"Difficulty ({names} | custom) [classic]: ").lower().strip()
+        if not choice:
+            return DIFFICULTIES['classic']
+        if choice in DIFFICULTIES:
+            return DIFFICULTIES[choice]
+        if choice == 'custom':
+            try:
+                width = int(input("Width: "))
+                height = int(input("Height: "))
+                num_mines = int(input("Mines: "))
+            except ValueError:
+                print("Please enter whole numbers.")
+                continue
+            if width >= 1 and height >= 1 and 0 <= num_mines < width * height:
+                return width, height, num_mines
+            print("Invalid size or number of mines.")
+        else:
+            print("Unknown difficulty.")
+
 def main():
     """Entry point for the Minesweeper game."""
     clear_screen()
-    print("MINESWEEPER - 5x5 grid with 4 mines")
-    print("Use standard notation: A1, B3, etc.")
+    print("MINESWEEPER")
+    print("Use standard notation: A1, B3, AA10, etc.")
     print("Type 'h' for help during the game")
-    input("Press Enter to start...")
+    if os.path.exists(SAVE_FILE):
+        if input("Resume saved game? (y/n) [y]: ").lower().strip() != 'n':
+            play_game(state=load(SAVE_FILE))
+            return
+    
+    width, height, num_mines = choose_settings()
+    lazy = input("Safe first click? (y/n) [y]: ").lower().strip() != 'n'
     
-    play_game()
+    play_game(width, height, num_mines, lazy)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,218 @@
+"""
+No-Guess Minesweeper Boards
+
+Generates boards that can be solved from the first click by deduction
+alone. Candidates keep the first click and its neighbours free of mines
+(so the click always opens an area) and are checked by playing them with
+the deterministic ``solver``. Most random candidates need a guess
+somewhere, so candidates are generated and verified in batches across a
+process pool and the first board that passes is returned. The pool shares
+a generation counter with its workers; once a board is found the counter
+moves on, and batches still running for that board stop at their next
+candidate instead of delaying the next board.
+
+Classes:
+    NoGuessGenerator: Keeps a worker pool alive between boards
+
+Usage:
+    $ python minesweeper/no_guess.py [width height mines]
+"""
+
+import multiprocessing
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from generation import generate_counts, safe_zone
+from solver import solve
+from state import MinesweeperState
+
+# The generator's shared generation counter, inside worker processes
+_generation = None
+
+
+def _init_worker(generation):
+    """Keep the shared generation counter in a new worker process."""
+    global _generation
+    _generation = generation
+
+
+def try_seeds(width, height, num_mines, x, y, seeds, generation=None):
+    """
+    Generate and verify candidates until one is solvable.
+
+    Args:
+        width (int): Width of the board
+        height (int): Height of the board
+        num_mines (int): Number of mines to place
+        x (int): X-coordinate of the first click
+        y (int): Y-coordinate of the first click
+        seeds (list): Seeds of the candidates to try, in order
+        generation (int, optional): The board this batch works for; the
+                                    batch stops early once the shared
+                                    counter has moved past it
+
+    Returns:
+        tuple or None: (seed, counts) of the first solvable candidate, or
+                       None if none of them is (or the batch stopped)
+    """
+    excluded = safe_zone(width, height, x, y)
+    for seed in seeds:
+        if generation is not None and _generation.value != generation:
+            return None
+        counts = generate_counts(width, height, num_mines, seed, excluded)
+        if solve(MinesweeperState(width, height, counts), x, y):
+            return seed, counts
+    return None
+
+
+class NoGuessGenerator:
+    """
+    Generates no-guess boards with a reusable pool of worker processes.
+
+    Starting processes costs far more than verifying a beginner board, so
+    a lobby should create one generator and keep it for its lifetime.
+
+    Attributes:
+        workers (int): Number of worker processes (1 runs in-process)
+        batch_size (int): Candidates each task tries before reporting back
+        max_candidates (int): Give up after trying this many candidates
+    """
+
+    def __init__(self, workers=None, batch_size=4, max_candidates=10_000):
+        """
+        Initialize the generator.
+
+        Args:
+            workers (int, optional): Worker processes; defaults to the CPU
+                                     count
+            batch_size (int): Candidates per task (default 4)
+            max_candidates (int): Candidate limit per board (default 10,000)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.max_candidates = max_candidates
+        self._pool = None
+        if self.workers > 1:
+            # Only this process writes the counter, so it needs no lock
+            self._generation = multiprocessing.RawValue("q", 0)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker,
+                initargs=(self._generation,))
+
+    def generate(self, width, height, num_mines, x, y, seed=None):
+        """
+        Generate a board solvable from a first click at (x, y).
+
+        Args:
+            width (int): Width of the board
+            height (int): Height of the board
+            num_mines (int): Number of mines to place
+            x (int): X-coordinate of the first click
+            y (int): Y-coordinate of the first click
+            seed (int, optional): Seed for the candidate seeds. With more
+                                  than one worker the board returned is the
+                                  first one verified, which may vary from
+                                  run to run
+
+        Returns:
+            MinesweeperState: A fresh game on the verified board
+
+        Raises:
+            RuntimeError: If no candidate passed within max_candidates
+        """
+        rng = random.Random(seed)
+        batches = (self.max_candidates + self.batch_size - 1) // self.batch_size
+
+        def next_batch():
+            return [rng.getrandbits(63) for _ in range(self.batch_size)]
+
+        if self._pool is None:
+            for _ in range(batches):
+                found = try_seeds(width, height, num_mines, x, y, next_batch())
+                if found:
+                    return MinesweeperState(width, height, found[1], found[0])
+            raise RuntimeError("No solvable board found")
+
+        # Keep every worker busy with one batch; refill as batches fail
+        generation = self._generation.value
+        pending = set()
+        submitted = 0
+        try:
+            while submitted < batches or pending:
+                while submitted < batches and len(pending) < self.workers:
+                    pending.add(self._pool.submit(
+                        try_seeds, width, height, num_mines, x, y, next_batch(),
+                        generation))
+                    submitted += 1
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found = future.result()
+                    if found:
+                        return MinesweeperState(width, height, found[1], found[0])
+        finally:
+            # Batches already running stop at their next candidate
+            self._generation.value += 1
+            for future in pending:
+                future.cancel()
+        raise RuntimeError("No solvable board found")
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def generate_no_guess(width, height, num_mines, x, y, seed=None, workers=1):
+    """
+    Generate one no-guess board.
+
+    Args:
+        width (int): Width of the board
+        height (int): Height of the board
+        num_mines (int): Number of mines to place
+        x (int): X-coordinate of the first click
+        y (int): Y-coordinate of the first click
+        seed (int, optional): Seed for reproducible boards (with workers=1)
+        workers (int): Worker processes to use (default 1, in-process)
+
+    Returns:
+        MinesweeperState: A fresh game on the verified board
+    """
+    with NoGuessGenerator(workers) as generator:
+        return generator.generate(width, height, num_mines, x, y, seed)
+
+
+def main():
+    """Time no-guess generation and print latency percentiles."""
+    if len(sys.argv) > 3:
+        width, height, num_mines = (int(arg) for arg in sys.argv[1:4])
+    else:
+        width, height, num_mines = 30, 16, 99
+
+    with NoGuessGenerator() as generator:
+        timings = []
+        for seed in range(50):
+            start = time.perf_counter()
+            generator.generate(width, height, num_mines, width // 2,
+                               height // 2, seed)
+            timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    print(f"{width}x{height}, {num_mines} mines, {generator.workers} workers")
+    for label, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+        print(f"{label}: {timings[int(q * (len(timings) - 1))] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
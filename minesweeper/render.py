@@ -0,0 +1,154 @@
+"""
+Differential Terminal Renderer for Minesweeper
+
+Draws the board once, then on every move only moves the cursor to the
+cells that changed and rewrites them with ANSI escape codes, instead of
+clearing the screen and reprinting every cell. Each frame is written to
+the stream with a single call, so large boards update without flicker
+and without starting a subprocess to clear the screen.
+"""
+
+import sys
+
+from coordinates import column_name
+
+CLEAR = "\x1b[H\x1b[2J"
+CLEAR_BELOW = "\x1b[J"
+# Rewriting a cell costs about 8 times more than printing it in a full
+# frame, so a move that changes more cells than this is redrawn in full
+FULL_REDRAW_FRACTION = 0.125
+
+
+def move_to(row, col):
+    """Return the escape code moving the cursor to a 1-based row and column."""
+    return f"\x1b[{row};{col}H"
+
+
+class DiffRenderer:
+    """
+    Renders a MinesweeperState by redrawing only the cells that changed.
+
+    The screen layout is the header lines, a row of column names, one
+    line per board row, and then the message/prompt area. Every cell is as
+    wide as the longest column name, plus a space.
+
+    Attributes:
+        header (list): Lines printed above the board on a full redraw
+        stream (file, optional): Where to write; defaults to sys.stdout
+    """
+
+    def __init__(self, header=(), stream=None):
+        """
+        Initialize the renderer.
+
+        Args:
+            header (iterable): Lines shown above the board
+            stream (file, optional): Output stream, sys.stdout if omitted
+        """
+        self.header = list(header)
+        self.stream = stream
+        self._frame = None  # Copy of state.view as last drawn
+        self._size = None
+
+    def invalidate(self):
+        """Force a full redraw next time, e.g. after the screen was cleared."""
+        self._frame = None
+
+    def _layout(self, state):
+        """Return (first board row, column of cell 0, label width, cell width)."""
+        label_width = len(str(state.height)) + 1
+        cell_width = len(column_name(state.width - 1))
+        # Cell characters are right-aligned under their column names
+        return (len(self.header) + 2, label_width + cell_width, label_width,
+                cell_width)
+
+    def draw(self, state, changed=None, message=""):
+        """
+        Bring the screen up to date with the state.
+
+        Args:
+            state (MinesweeperState): The game to draw
+            changed (iterable, optional): Flat indices of cells that may
+                                          have changed since the last frame.
+                                          None, or a large share of the
+                                          board, forces a full redraw
+            message (str): Text shown below the board, above the prompt
+        """
+        top, left, label_width, cell_width = self._layout(state)
+        view = state.view
+        size = (state.width, state.height)
+
+        if changed is not None:
+            changed = set(changed)
+        if (changed is None or self._frame is None or self._size != size or
+                len(changed) > FULL_REDRAW_FRACTION * len(view)):
+            parts = [CLEAR, self._full_frame(state, label_width, cell_width)]
+            self._frame = bytearray(view)
+            self._size = size
+        else:
+            parts = self._diff(state, changed, top, left, cell_width)
+
+        # Reset the message area and leave the cursor where input goes
+        parts.append(move_to(top + state.height, 1) + CLEAR_BELOW)
+        if message:
+            parts.append(message + "\n")
+
+        stream = self.stream or sys.stdout
+        stream.write("".join(parts))
+        stream.flush()
+
+    def _full_frame(self, state, label_width, cell_width):
+        """Render the whole screen as one string."""
+        width = state.width
+        view = state.view
+        pad = " " * (cell_width - 1)
+        separator = " " + pad
+
+        lines = list(self.header)
+        lines.append(" " * label_width + "".join(
+            f"{column_name(x):>{cell_width}} " for x in range(width)))
+        for y in range(state.height):
+            row = view[y * width:(y + 1) * width].decode("ascii")
+            lines.append(f"{y + 1:<{label_width}}" + pad +
+                         separator.join(row) + " ")
+        return "\n".join(lines) + "\n"
+
+    def _diff(self, state, changed, top, left, cell_width):
+        """
+        Render escape codes that rewrite the changed cells.
+
+        Consecutive changed cells in one row are written after a single
+        cursor move. Only the rewritten cells are copied into the frame.
+        """
+        width = state.width
+        view, frame = state.view, self._frame
+        parts = []
+        run_start = run_end = None
+        run = []
+
+        for index in sorted(changed):
+            if view[index] == frame[index]:
+                continue
+            frame[index] = view[index]
+            if run and index == run_end + 1 and index % width:
+                run.append(chr(view[index]))
+                run_end = index
+                continue
+            if run:
+                parts.append(self._run(run_start, run, width, top, left,
+                                       cell_width))
+            run_start = run_end = index
+            run = [chr(view[index])]
+
+        if run:
+            parts.append(self._run(run_start, run, width, top, left,
+                                   cell_width))
+        return parts
+
+    @staticmethod
+    def _run(start, chars, width, top, left, cell_width):
+        """Render one horizontal run of changed cells."""
+        y, x = divmod(start, width)
+        separator = " " * cell_width
+        return (move_to(top + y, left + (cell_width + 1) * x) +
+                separator.join(chars))
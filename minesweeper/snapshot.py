@@ -0,0 +1,242 @@
+"""
+Compact Binary Snapshots of Minesweeper Games
+
+A snapshot stores a MinesweeperState in about ``width * height / 4``
+bytes:
+
+- a header (magic, version, size, mine count, seed, flag count);
+- the mines as a bitmap, one bit per cell;
+- the revealed cells as a bitmap, one bit per cell;
+- the flagged cells as a list of 32-bit cell indices (flags are sparse).
+
+Neighbour counts are not stored; they are recomputed from the mines.
+Bitmaps are packed without a Python loop per cell: the 0/1 bytes are
+translated to the ASCII digits '0'/'1' and parsed with ``int(..., 2)``,
+and unpacked by formatting the integer back as binary digits. Bits are
+stored most significant first, so cell i is bit ``7 - i % 8`` of byte
+``i // 8``.
+
+A ``Snapshot`` memory-maps the file and only reads the header when it is
+opened; each bitmap is decoded straight from the map when it is asked for,
+so the board size or the flags can be read without unpacking anything.
+``load`` rebuilds the whole game, so it decodes everything at once.
+"""
+
+import mmap
+import os
+import struct
+
+from generation import MINE, count_neighbours
+from state import DIGITS, HIDDEN, MINE_CHAR, MinesweeperState
+
+MAGIC = b"MSWS"
+VERSION = 1
+# magic, version, has seed, width, height, mines, seed, flags
+HEADER = struct.Struct("<4sHBIIIqI")
+
+# Maps cell bytes to '0'/'1' digits for packing
+_MINE_DIGITS = bytes.maketrans(bytes(range(256)),
+                               b"0" * MINE + b"1" + b"0" * (255 - MINE))
+_CELL_DIGITS = bytes.maketrans(bytes(range(256)), b"0" + b"1" * 255)
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+# Maps (revealed << 4 | count) to the character shown for the cell
+_TO_VIEW = bytes.maketrans(
+    bytes(range(256)),
+    bytes([HIDDEN]) * 16 + DIGITS + bytes([MINE_CHAR]) +
+    bytes([HIDDEN]) * (256 - 16 - len(DIGITS) - 1))
+
+
+def pack_bits(cells, table):
+    """
+    Pack one bit per cell into bytes.
+
+    Args:
+        cells (bytes): One byte per cell
+        table (bytes): Translation table mapping cell bytes to '0' or '1'
+
+    Returns:
+        bytes: ceil(len(cells) / 8) bytes, most significant bit first
+    """
+    size = (len(cells) + 7) // 8
+    if not size:
+        return b""
+    digits = cells.translate(table).decode("ascii")
+    digits += "0" * (size * 8 - len(cells))
+    return int(digits, 2).to_bytes(size, "big")
+
+
+def unpack_bits(data, count):
+    """
+    Unpack bits produced by ``pack_bits``.
+
+    Args:
+        data (bytes-like): The packed bits
+        count (int): Number of cells
+
+    Returns:
+        bytearray: One byte (0 or 1) per cell
+    """
+    if not count:
+        return bytearray()
+    digits = format(int.from_bytes(data, "big"), f"0{len(data) * 8}b")
+    return bytearray(digits[:count].encode("ascii").translate(_FROM_DIGITS))
+
+
+def save(state, path):
+    """
+    Write a snapshot of a game.
+
+    The file is written next to its destination and then renamed over it,
+    so an interrupted save never leaves a truncated snapshot behind.
+
+    Args:
+        state (MinesweeperState): The game to save
+        path (str): Destination file
+    """
+    flags = []
+    index = state.flagged.find(1)
+    while index != -1:
+        flags.append(index)
+        index = state.flagged.find(1, index + 1)
+
+    seed = state.seed
+    header = HEADER.pack(MAGIC, VERSION, seed is not None, state.width,
+                         state.height, state.num_mines, seed or 0, len(flags))
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(header)
+        f.write(pack_bits(state.counts, _MINE_DIGITS))
+        f.write(pack_bits(state.revealed, _CELL_DIGITS))
+        f.write(struct.pack(f"<{len(flags)}I", *flags))
+    os.replace(temporary, path)
+
+
+class Snapshot:
+    """
+    A memory-mapped snapshot file.
+
+    Only the header is read when the snapshot is opened.
+
+    Attributes:
+        width (int): Width of the board
+        height (int): Height of the board
+        num_mines (int): Number of mines
+        seed (int or None): Seed the board was generated from
+        num_flags (int): Number of flagged cells
+    """
+
+    def __init__(self, path):
+        """
+        Open a snapshot.
+
+        Args:
+            path (str): The snapshot file
+
+        Raises:
+            ValueError: If the file is not a snapshot this version can read,
+                        or is truncated
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a Minesweeper snapshot")
+        (magic, version, has_seed, self.width, self.height, self.num_mines,
+         seed, self.num_flags) = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} "
+                             "Minesweeper snapshot")
+        self.seed = seed if has_seed else None
+        self._bitmap_size = (self.width * self.height + 7) // 8
+        if len(self._map) != (HEADER.size + 2 * self._bitmap_size +
+                              4 * self.num_flags):
+            self.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+
+    def _unpack_section(self, number):
+        """
+        Decode bitmap 0 (mines) or 1 (revealed) without copying it out.
+
+        Returns:
+            bytearray: One byte (0 or 1) per cell
+        """
+        start = HEADER.size + number * self._bitmap_size
+        with memoryview(self._map) as view:
+            with view[start:start + self._bitmap_size] as section:
+                return unpack_bits(section, self.width * self.height)
+
+    def mines(self):
+        """Return the mine bitmap unpacked to one byte (0 or 1) per cell."""
+        return self._unpack_section(0)
+
+    def revealed(self):
+        """Return the revealed bitmap unpacked to one byte per cell."""
+        return self._unpack_section(1)
+
+    def flags(self):
+        """Return the flat indices of the flagged cells."""
+        start = HEADER.size + 2 * self._bitmap_size
+        return struct.unpack_from(f"<{self.num_flags}I", self._map, start)
+
+    def state(self):
+        """
+        Rebuild the game.
+
+        Returns:
+            MinesweeperState: The game as it was saved
+        """
+        width, height = self.width, self.height
+        mines = self.mines()
+        mine_cells = []
+        index = mines.find(1)
+        while index != -1:
+            mine_cells.append(index)
+            index = mines.find(1, index + 1)
+        counts = count_neighbours(mine_cells, width, height)
+        state = MinesweeperState(width, height, counts, self.seed)
+
+        revealed = self.revealed()
+        state.revealed = revealed
+        if revealed:
+            # revealed (0/1) << 4 | count (0-9) never carries between bytes,
+            # so one big-integer operation combines the buffers
+            combined = ((int.from_bytes(revealed, "big") << 4 |
+                         int.from_bytes(counts, "big"))
+                        .to_bytes(len(counts), "big"))
+            state.view = bytearray(combined.translate(_TO_VIEW))
+            exploded = combined.find(0x10 | MINE)
+            if exploded != -1:
+                state.exploded = exploded
+        state.revealed_count = revealed.count(1) - (state.exploded is not None)
+
+        for index in self.flags():
+            state.toggle_flag(index % width, index // width)
+        return state
+
+    def close(self):
+        """Unmap the file."""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load(path):
+    """
+    Load a game from a snapshot.
+
+    This decodes every section; open a ``Snapshot`` to read only some.
+
+    Args:
+        path (str): The snapshot file
+
+    Returns:
+        MinesweeperState: The game as it was saved
+    """
+    with Snapshot(path) as snapshot:
+        return snapshot.state()
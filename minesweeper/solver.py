@@ -0,0 +1,384 @@
+"""
+Minesweeper Solver
+
+Works on a MinesweeperState using only what a player can see: the
+numbers on revealed cells, plus the mines the solver has already proven.
+Deductions are tried from cheapest to most expensive:
+
+1. Single-cell rules: a number whose remaining mines is 0 makes all its
+   hidden neighbours safe; one equal to its hidden neighbour count makes
+   them all mines.
+2. Pairwise subset rules: for two overlapping constraints A and B, if B
+   needs exactly as many more mines as it has cells outside A, those
+   cells are mines and A's cells outside B are safe.
+3. Exact probabilities: the frontier (hidden cells next to a number) is
+   split into independent connected components, each component's mine
+   layouts are enumerated on their own, and the results are combined
+   with the global mine count. Cells with probability 0 or 1 are certain.
+
+Splitting the frontier into components keeps the enumeration to the
+product of small searches rather than one search over the whole frontier.
+"""
+
+from functools import lru_cache
+from math import comb
+
+from generation import MINE
+
+_OFFSETS = ((-1, -1), (0, -1), (1, -1),
+            (-1, 0),           (1, 0),
+            (-1, 1),  (0, 1),  (1, 1))
+
+
+def neighbours(index, width, height):
+    """
+    List the cells around a cell.
+
+    Args:
+        index (int): Flat index of the cell
+        width (int): Width of the board
+        height (int): Height of the board
+
+    Returns:
+        list: Flat indices of the up to 8 adjacent cells
+    """
+    y, x = divmod(index, width)
+    return [(y + dy) * width + x + dx
+            for dx, dy in _OFFSETS
+            if 0 <= x + dx < width and 0 <= y + dy < height]
+
+
+@lru_cache(maxsize=8)
+def neighbour_table(width, height):
+    """
+    Precompute ``neighbours`` for every cell of a board size.
+
+    Returns:
+        tuple: One tuple of adjacent flat indices per cell
+    """
+    return tuple(tuple(neighbours(index, width, height))
+                 for index in range(width * height))
+
+
+def frontier_constraints(state, known_mines):
+    """
+    Collect one constraint per revealed number with unknown neighbours.
+
+    Args:
+        state (MinesweeperState): The game being solved
+        known_mines (set): Flat indices of cells proven to be mines
+
+    Returns:
+        dict: Maps frozensets of unknown cells to the number of mines
+              among them
+    """
+    table = neighbour_table(state.width, state.height)
+    counts, revealed = state.counts, state.revealed
+    constraints = {}
+
+    index = revealed.find(1)
+    while index != -1:
+        value = counts[index]
+        # Cells without adjacent mines were flooded, so nothing is hidden
+        if value != MINE and value != 0:
+            unknown = []
+            for other in table[index]:
+                if other in known_mines:
+                    value -= 1
+                elif not revealed[other]:
+                    unknown.append(other)
+            if unknown:
+                constraints[frozenset(unknown)] = value
+        index = revealed.find(1, index + 1)
+    return constraints
+
+
+def deduce(state, known_mines):
+    """
+    Apply the single-cell and pairwise subset rules.
+
+    Args:
+        state (MinesweeperState): The game being solved
+        known_mines (set): Flat indices of cells proven to be mines
+
+    Returns:
+        tuple: (set of safe cells, set of new mine cells)
+    """
+    constraints = frontier_constraints(state, known_mines)
+    safe, mines = set(), set()
+
+    # Single-cell rules
+    for cells, value in constraints.items():
+        if value == 0:
+            safe |= cells
+        elif value == len(cells):
+            mines |= cells
+    if safe or mines:
+        return safe, mines
+
+    # Pairwise rules over constraints that share a cell
+    by_cell = {}
+    for cells in constraints:
+        for cell in cells:
+            by_cell.setdefault(cell, []).append(cells)
+
+    for a, value_a in constraints.items():
+        others = {b for cell in a for b in by_cell[cell] if b is not a}
+        for b in others:
+            only_b = b - a
+            if only_b and constraints[b] - value_a == len(only_b):
+                mines |= only_b
+                safe |= a - b
+    return safe, mines
+
+
+def _components(constraints):
+    """
+    Split the frontier into groups of cells linked by shared constraints.
+
+    Returns:
+        list: (cells in search order, constraints) pairs, one per component
+    """
+    parent = {}
+
+    def find(cell):
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    for cells in constraints:
+        cells = iter(cells)
+        first = next(cells)
+        parent.setdefault(first, first)
+        for cell in cells:
+            parent.setdefault(cell, cell)
+            parent[find(cell)] = find(first)
+
+    groups = {}
+    for cells, value in constraints.items():
+        groups.setdefault(find(next(iter(cells))), []).append((cells, value))
+
+    components = []
+    for group in groups.values():
+        # Search cells constraint by constraint so failures are found early
+        order, seen = [], set()
+        for cells, _ in group:
+            for cell in sorted(cells):
+                if cell not in seen:
+                    seen.add(cell)
+                    order.append(cell)
+        components.append((order, group))
+    return components
+
+
+def _enumerate(order, group):
+    """
+    Count the mine layouts of one component.
+
+    Args:
+        order (list): The component's cells in search order
+        group (list): The component's (cells, value) constraints
+
+    Returns:
+        tuple: (solutions, per_cell) where solutions[m] is the number of
+               layouts with m mines and per_cell[m][i] how many of those
+               put a mine on order[i]
+    """
+    values = [value for _, value in group]
+    assigned = [0] * len(group)
+    remaining = [len(cells) for cells, _ in group]
+    cell_constraints = [[j for j, (cells, _) in enumerate(group) if cell in cells]
+                        for cell in order]
+
+    size = len(order)
+    solutions = [0] * (size + 1)
+    per_cell = [[0] * size for _ in range(size + 1)]
+    layout = [0] * size
+
+    def search(k, mines):
+        if k == size:
+            solutions[mines] += 1
+            hits = per_cell[mines]
+            for i in range(size):
+                if layout[i]:
+                    hits[i] += 1
+            return
+
+        linked = cell_constraints[k]
+        for mine in (0, 1):
+            ok = True
+            for j in linked:
+                remaining[j] -= 1
+                assigned[j] += mine
+                if assigned[j] > values[j] or assigned[j] + remaining[j] < values[j]:
+                    ok = False
+            if ok:
+                layout[k] = mine
+                search(k + 1, mines + mine)
+            for j in linked:
+                remaining[j] += 1
+                assigned[j] -= mine
+        layout[k] = 0
+
+    search(0, 0)
+    return solutions, per_cell
+
+
+def _convolve(a, b):
+    """Multiply two polynomials given as coefficient lists."""
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def probability_weights(state, known_mines):
+    """
+    Compute exact mine weights for every unknown cell.
+
+    Probabilities are weight / total. All arithmetic is on integers, so a
+    weight of 0 or ``total`` proves a cell safe or a mine.
+
+    Args:
+        state (MinesweeperState): The game being solved
+        known_mines (set): Flat indices of cells proven to be mines
+
+    Returns:
+        tuple: (weights, interior_weight, interior_cells, total) where
+               weights maps frontier cells to their weight,
+               interior_weight applies to each of interior_cells (unknown
+               cells next to no number), and total is the number of
+               layouts consistent with everything visible
+    """
+    constraints = frontier_constraints(state, known_mines)
+    components = [(order, _enumerate(order, group))
+                  for order, group in _components(constraints)]
+
+    frontier = {cell for cells in constraints for cell in cells}
+    interior = [index for index in range(state.width * state.height)
+                if not state.revealed[index]
+                and index not in known_mines and index not in frontier]
+    mines_left = state.num_mines - len(known_mines)
+    n_interior = len(interior)
+
+    def interior_layouts(frontier_mines):
+        rest = mines_left - frontier_mines
+        return comb(n_interior, rest) if 0 <= rest <= n_interior else 0
+
+    # Distribution of frontier mines over all components together
+    total_dist = [1]
+    for _, (solutions, _) in components:
+        total_dist = _convolve(total_dist, solutions)
+
+    total = sum(count * interior_layouts(m) for m, count in enumerate(total_dist))
+
+    # Layouts with a mine on one given interior cell
+    interior_weight = 0
+    if n_interior:
+        interior_weight = sum(
+            count * comb(n_interior - 1, mines_left - m - 1)
+            for m, count in enumerate(total_dist)
+            if 0 <= mines_left - m - 1 <= n_interior - 1)
+
+    weights = {}
+    for k, (order, (solutions, per_cell)) in enumerate(components):
+        # Distribution of mines over every other component
+        others = [1]
+        for j, (_, (other_solutions, _)) in enumerate(components):
+            if j != k:
+                others = _convolve(others, other_solutions)
+
+        # rest_weight[m]: layouts of everything else if this component has m
+        rest_weight = [sum(count * interior_layouts(m + t)
+                           for t, count in enumerate(others))
+                       for m in range(len(solutions))]
+        for i, cell in enumerate(order):
+            weights[cell] = sum(per_cell[m][i] * rest_weight[m]
+                                for m in range(len(solutions)))
+
+    return weights, interior_weight, interior, total
+
+
+def mine_probabilities(state, known_mines):
+    """
+    Compute the exact mine probability of every unknown cell.
+
+    Args:
+        state (MinesweeperState): The game being solved
+        known_mines (set): Flat indices of cells proven to be mines
+
+    Returns:
+        dict: Maps flat indices of unknown cells to probabilities
+    """
+    weights, interior_weight, interior, total = probability_weights(
+        state, known_mines)
+    if not total:
+        raise ValueError("The visible numbers are inconsistent")
+    probabilities = {cell: weight / total for cell, weight in weights.items()}
+    interior_probability = interior_weight / total
+    for cell in interior:
+        probabilities[cell] = interior_probability
+    return probabilities
+
+
+def certain_cells(state, known_mines):
+    """
+    Find every cell whose state can be proven, using all three rules.
+
+    Args:
+        state (MinesweeperState): The game being solved
+        known_mines (set): Flat indices of cells proven to be mines
+
+    Returns:
+        tuple: (set of safe cells, set of new mine cells)
+    """
+    safe, mines = deduce(state, known_mines)
+    if safe or mines:
+        return safe, mines
+
+    weights, interior_weight, interior, total = probability_weights(
+        state, known_mines)
+    for cell, weight in weights.items():
+        if weight == 0:
+            safe.add(cell)
+        elif weight == total:
+            mines.add(cell)
+    if interior_weight == 0:
+        safe.update(interior)
+    elif interior_weight == total:
+        mines.update(interior)
+    return safe, mines
+
+
+def solve(state, x, y, use_probabilities=True):
+    """
+    Play a game from a first click without ever guessing.
+
+    The state is modified as cells are revealed.
+
+    Args:
+        state (MinesweeperState): A game with nothing revealed
+        x (int): X-coordinate of the first click
+        y (int): Y-coordinate of the first click
+        use_probabilities (bool): Also use exact probabilities (rule 3)
+                                  when the cheaper rules are stuck
+
+    Returns:
+        bool: True if every safe cell was revealed by deduction alone
+    """
+    state.reveal(x, y)
+    known_mines = set()
+    finder = certain_cells if use_probabilities else deduce
+
+    while state.exploded is None and not state.is_won():
+        safe, mines = finder(state, known_mines)
+        if not safe and not mines:
+            return False  # Only a guess could make progress
+        known_mines |= mines
+        for cell in safe:
+            state.reveal(cell % state.width, cell // state.width)
+
+    return state.exploded is None
@@ -0,0 +1,268 @@
+"""
+Compact Minesweeper Game State
+
+Holds one game in a few flat ``bytearray`` buffers (one byte per cell
+each) instead of lists of lists of one-character strings, so a process
+can keep thousands of games or very large boards in memory.
+"""
+
+from floodfill import flood_reveal, zero_mask
+from generation import MINE, counts_to_board, count_neighbours, generate_counts
+from solver import neighbours
+
+HIDDEN = ord(".")
+FLAG = ord("F")
+MINE_CHAR = ord("M")
+DIGITS = b"012345678"
+
+
+class MinesweeperState:
+    """
+    The state of one Minesweeper game.
+
+    Cell (x, y) is stored at index ``y * width + x`` of every buffer.
+
+    Attributes:
+        width (int): Width of the board
+        height (int): Height of the board
+        num_mines (int): Number of mines on the board
+        seed (int or None): Seed the board was generated from, if any
+        counts (bytearray): Adjacent mine counts 0-8, or MINE for mines
+        revealed (bytearray): 1 for revealed cells, 0 for hidden ones
+        flagged (bytearray): 1 for flagged cells, 0 for the others
+        flag_counts (bytearray): Number of flagged neighbours of each cell,
+                                 kept up to date as flags change
+        view (bytearray): The character shown for each cell ('.' while
+                          hidden, 'F' when flagged), kept up to date
+        revealed_count (int): Number of revealed cells
+        flags_placed (int): Number of flagged cells
+        exploded (int or None): Index of the mine that was revealed
+    """
+
+    __slots__ = ('width', 'height', 'num_mines', 'seed', 'counts',
+                 'revealed', 'flagged', 'flag_counts', 'view',
+                 'revealed_count', 'flags_placed', 'exploded', '_mask')
+
+    def __init__(self, width, height, counts, seed=None):
+        """
+        Initialize a game with nothing revealed.
+
+        Args:
+            width (int): Width of the board
+            height (int): Height of the board
+            counts (bytearray): Flat board with counts 0-8 and MINE
+            seed (int, optional): Seed the board was generated from
+        """
+        self.width = width
+        self.height = height
+        self.num_mines = counts.count(MINE)
+        self.seed = seed
+        self.counts = counts
+        self.revealed = bytearray(width * height)
+        self.flagged = bytearray(width * height)
+        self.flag_counts = bytearray(width * height)
+        self.view = bytearray([HIDDEN]) * (width * height)
+        self.revealed_count = 0
+        self.flags_placed = 0
+        self.exploded = None
+        self._mask = None
+
+    @classmethod
+    def new(cls, width, height, num_mines, seed=None):
+        """
+        Start a game on a random board.
+
+        Args:
+            width (int): Width of the board
+            height (int): Height of the board
+            num_mines (int): Number of mines to place
+            seed (int, optional): Seed for a reproducible board
+
+        Returns:
+            MinesweeperState: The new game
+        """
+        return cls(width, height, generate_counts(width, height, num_mines, seed),
+                   seed)
+
+    @classmethod
+    def from_board(cls, board):
+        """
+        Start a game on a board from ``create_board``.
+
+        Args:
+            board (list): 2D list with 'M' for mines and '0'-'8' elsewhere
+
+        Returns:
+            MinesweeperState: The new game
+        """
+        height = len(board)
+        width = len(board[0]) if height else 0
+        mines = [y * width + x
+                 for y, row in enumerate(board)
+                 for x, cell in enumerate(row)
+                 if cell == 'M']
+        return cls(width, height, count_neighbours(mines, width, height))
+
+    def to_board(self):
+        """
+        Convert the board to the list of lists of strings format.
+
+        Returns:
+            list: 2D list with 'M' for mines and '0'-'8' for other cells
+        """
+        return counts_to_board(self.counts, self.width, self.height)
+
+    def is_mine(self, x, y):
+        """Return True if there is a mine at (x, y)."""
+        return self.counts[y * self.width + x] == MINE
+
+    def is_revealed(self, x, y):
+        """Return True if the cell at (x, y) has been revealed."""
+        return self.revealed[y * self.width + x] == 1
+
+    def is_flagged(self, x, y):
+        """Return True if the cell at (x, y) is flagged."""
+        return self.flagged[y * self.width + x] == 1
+
+    def is_won(self):
+        """Return True once every safe cell has been revealed."""
+        return (self.exploded is None and
+                self.revealed_count == self.width * self.height - self.num_mines)
+
+    def reveal(self, x, y):
+        """
+        Reveal a cell, flooding its open region if it has no adjacent mines.
+
+        Revealing a mine sets ``exploded``. Flagged cells are not revealed
+        when clicked, but a flood clears any wrong flags it reaches.
+
+        Args:
+            x (int): X-coordinate of the cell
+            y (int): Y-coordinate of the cell
+
+        Returns:
+            list: Flat indices of the newly revealed cells
+        """
+        index = y * self.width + x
+        if self.revealed[index] or self.flagged[index]:
+            return []
+
+        if self.counts[index] == MINE:
+            self.revealed[index] = 1
+            self.view[index] = MINE_CHAR
+            self.exploded = index
+            return [index]
+
+        if self._mask is None:
+            self._mask = zero_mask(self.counts)
+        newly = flood_reveal(self.counts, self.revealed, self.width,
+                             self.height, x, y, self._mask)
+        self.revealed_count += len(newly)
+
+        counts, view, flagged = self.counts, self.view, self.flagged
+        for cell in newly:
+            view[cell] = DIGITS[counts[cell]]
+        if self.flags_placed:
+            for cell in newly:
+                if flagged[cell]:
+                    self._set_flag(cell, 0)
+        return newly
+
+    def _set_flag(self, index, value):
+        """Set or clear a flag and update the neighbours' flag counts."""
+        self.flagged[index] = value
+        step = 1 if value else -1
+        self.flags_placed += step
+        flag_counts = self.flag_counts
+        for other in neighbours(index, self.width, self.height):
+            flag_counts[other] += step
+
+    def toggle_flag(self, x, y):
+        """
+        Flag a hidden cell, or remove its flag.
+
+        Args:
+            x (int): X-coordinate of the cell
+            y (int): Y-coordinate of the cell
+
+        Returns:
+            list: The flat index of the cell if it changed, otherwise empty
+        """
+        index = y * self.width + x
+        if self.revealed[index]:
+            return []
+        flag = 0 if self.flagged[index] else 1
+        self._set_flag(index, flag)
+        self.view[index] = FLAG if flag else HIDDEN
+        return [index]
+
+    def can_chord(self, x, y):
+        """
+        Check in O(1) whether a number has as many flags around it as mines.
+
+        Args:
+            x (int): X-coordinate of the cell
+            y (int): Y-coordinate of the cell
+
+        Returns:
+            bool: True if the cell is a revealed number that is satisfied
+        """
+        index = y * self.width + x
+        count = self.counts[index]
+        return (self.revealed[index] == 1 and 0 < count < MINE and
+                self.flag_counts[index] == count)
+
+    def chord(self, x, y):
+        """
+        Reveal every unflagged neighbour of a satisfied number.
+
+        If a flag is wrong, this reveals a mine and sets ``exploded``.
+
+        Args:
+            x (int): X-coordinate of a revealed number
+            y (int): Y-coordinate of a revealed number
+
+        Returns:
+            list: Flat indices of the newly revealed cells
+        """
+        if not self.can_chord(x, y):
+            return []
+        newly = []
+        width = self.width
+        for other in neighbours(y * width + x, width, self.height):
+            if not self.revealed[other] and not self.flagged[other]:
+                newly += self.reveal(other % width, other // width)
+        return newly
+
+    def show_mines(self):
+        """
+        Mark every unflagged mine in ``view``, for the final board.
+
+        Returns:
+            list: Flat indices of the mines
+        """
+        mines = []
+        index = self.counts.find(MINE)
+        while index != -1:
+            mines.append(index)
+            if not self.flagged[index]:
+                self.view[index] = MINE_CHAR
+            index = self.counts.find(MINE, index + 1)
+        return mines
+
+    def char_at(self, x, y):
+        """Return the character currently shown for the cell at (x, y)."""
+        return chr(self.view[y * self.width + x])
+
+    def row_string(self, y):
+        """
+        Render one row of the board.
+
+        Args:
+            y (int): Row index
+
+        Returns:
+            str: The row's cell characters separated by spaces
+        """
+        start = y * self.width
+        return " ".join(self.view[start:start + self.width].decode("ascii"))
@@ -0,0 +1,468 @@
+"""
+Endless Minesweeper World
+
+The world has no edges. It is split into square chunks of
+``chunk_size`` cells; chunk (cx, cy) covers world cells
+``cx * chunk_size <= x < (cx + 1) * chunk_size`` and likewise for y.
+
+- A chunk's mines are generated from the world seed and the chunk
+  coordinates the first time it is touched, so the same seed always
+  gives the same world and chunks never need to store their mines.
+- Loaded chunks live in an LRU cache of at most ``max_chunks`` entries.
+  When a chunk with revealed or flagged cells is evicted, those cells are
+  written to a small file in the world's directory and read back when the
+  chunk is needed again, so memory stays bounded however far the player
+  explores.
+- Neighbour counts on chunk edges look at the mines of the adjacent
+  chunks, and reveals flood across chunk boundaries.
+- The origin cell (0, 0) and its neighbours never hold a mine, so the
+  first click at the origin always opens an area.
+
+Classes:
+    Chunk: The state of one loaded chunk
+    World: The endless board
+    Viewport: A window onto the world for the renderer
+
+Usage:
+    $ python minesweeper/world.py [seed]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from collections import OrderedDict, deque
+from functools import lru_cache
+
+from generation import MINE, count_neighbours, place_mines
+from minesweeper import parse_coordinates
+from render import DiffRenderer
+from state import DIGITS, HIDDEN
+
+_OFFSETS = ((-1, -1), (0, -1), (1, -1),
+            (-1, 0),           (1, 0),
+            (-1, 1),  (0, 1),  (1, 1))
+
+
+@lru_cache(maxsize=1024)
+def chunk_mines(seed, chunk_size, mines_per_chunk, cx, cy):
+    """
+    Generate the mines of one chunk.
+
+    Args:
+        seed (int): Seed of the world
+        chunk_size (int): Width and height of a chunk
+        mines_per_chunk (int): Number of mines in every chunk
+        cx (int): X-coordinate of the chunk
+        cy (int): Y-coordinate of the chunk
+
+    Returns:
+        tuple: Local flat indices (``y * chunk_size + x``) of the mines
+    """
+    # Keep the origin and its neighbours safe
+    excluded = [(wy - cy * chunk_size) * chunk_size + wx - cx * chunk_size
+                for wy in (-1, 0, 1) for wx in (-1, 0, 1)
+                if wx // chunk_size == cx and wy // chunk_size == cy]
+    return tuple(place_mines(chunk_size, chunk_size, mines_per_chunk,
+                             f"{seed}:{cx}:{cy}", excluded))
+
+
+class Chunk:
+    """
+    The state of one loaded chunk.
+
+    Attributes:
+        cx (int): X-coordinate of the chunk
+        cy (int): Y-coordinate of the chunk
+        counts (bytearray): Local neighbour counts 0-8, or MINE for mines
+        revealed (bytearray): 1 for revealed cells, 0 for hidden ones
+        flagged (bytearray): 1 for flagged cells, 0 for the others
+        dirty (bool): Whether the chunk changed since it was last saved
+    """
+
+    __slots__ = ('cx', 'cy', 'counts', 'revealed', 'flagged', 'dirty')
+
+    def __init__(self, cx, cy, counts, revealed=None, flagged=None):
+        """
+        Initialize a chunk.
+
+        Args:
+            cx (int): X-coordinate of the chunk
+            cy (int): Y-coordinate of the chunk
+            counts (bytearray): Local neighbour counts
+            revealed (bytearray, optional): Saved revealed cells
+            flagged (bytearray, optional): Saved flagged cells
+        """
+        self.cx = cx
+        self.cy = cy
+        self.counts = counts
+        if revealed is None:
+            revealed = bytearray(len(counts))
+        if flagged is None:
+            flagged = bytearray(len(counts))
+        self.revealed = revealed
+        self.flagged = flagged
+        self.dirty = False
+
+
+class World:
+    """
+    An endless Minesweeper board made of lazily generated chunks.
+
+    Attributes:
+        seed (int): Seed of the world
+        chunk_size (int): Width and height of a chunk
+        mines_per_chunk (int): Number of mines in every chunk
+        max_chunks (int): Most chunks kept in memory at once
+        directory (str): Where evicted chunks are saved; removed by
+                         ``close()`` if the world created it
+        revealed_count (int): Number of revealed cells
+        exploded (tuple or None): (x, y) of the mine that was revealed
+    """
+
+    def __init__(self, seed=0, density=0.15, chunk_size=32, max_chunks=256,
+                 directory=None):
+        """
+        Initialize the world.
+
+        Args:
+            seed (int): Seed of the world (default 0)
+            density (float): Fraction of cells holding a mine (default 0.15)
+            chunk_size (int): Width and height of a chunk (default 32)
+            max_chunks (int): Chunks kept in memory at once (default 256)
+            directory (str, optional): Where evicted chunks are saved; a new
+                                       temporary directory if omitted
+        """
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.mines_per_chunk = round(density * chunk_size * chunk_size)
+        self.max_chunks = max_chunks
+        self._owns_directory = directory is None
+        self.directory = directory or tempfile.mkdtemp(prefix="minesweeper-")
+        os.makedirs(self.directory, exist_ok=True)
+        self.revealed_count = 0
+        self.exploded = None
+        self._chunks = OrderedDict()
+
+    def _path(self, cx, cy):
+        """Return the file an evicted chunk is saved to."""
+        return os.path.join(self.directory, f"{cx}_{cy}.chunk")
+
+    def _counts(self, cx, cy):
+        """
+        Compute a chunk's neighbour counts, including mines across its edges.
+
+        The chunk and a one-cell ring around it are laid out as one padded
+        board, counted with ``count_neighbours`` and cropped.
+        """
+        size = self.chunk_size
+        padded = size + 2
+        mines = []
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                for index in chunk_mines(self.seed, size, self.mines_per_chunk,
+                                         cx + dx, cy + dy):
+                    y, x = divmod(index, size)
+                    x += dx * size
+                    y += dy * size
+                    if -1 <= x <= size and -1 <= y <= size:
+                        mines.append((y + 1) * padded + x + 1)
+
+        grid = count_neighbours(mines, padded, padded)
+        counts = bytearray()
+        for y in range(1, size + 1):
+            counts += grid[y * padded + 1:y * padded + 1 + size]
+        return counts
+
+    def chunk_at(self, cx, cy):
+        """
+        Return a chunk, generating or loading it if it is not in memory.
+
+        Args:
+            cx (int): X-coordinate of the chunk
+            cy (int): Y-coordinate of the chunk
+
+        Returns:
+            Chunk: The chunk, now the most recently used one
+
+        Raises:
+            ValueError: If the chunk's saved file has the wrong length
+        """
+        key = (cx, cy)
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+
+        revealed = flagged = None
+        path = self._path(cx, cy)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                data = f.read()
+            cells = self.chunk_size * self.chunk_size
+            if len(data) != 2 * cells:
+                raise ValueError(f"{path} is not a saved {self.chunk_size}x"
+                                 f"{self.chunk_size} chunk")
+            revealed = bytearray(data[:cells])
+            flagged = bytearray(data[cells:])
+        chunk = Chunk(cx, cy, self._counts(cx, cy), revealed, flagged)
+
+        self._chunks[key] = chunk
+        if len(self._chunks) > self.max_chunks:
+            self._save(self._chunks.popitem(last=False)[1])
+        return chunk
+
+    def _save(self, chunk):
+        """Write a chunk's revealed and flagged cells if they changed."""
+        if chunk.dirty:
+            with open(self._path(chunk.cx, chunk.cy), "wb") as f:
+                f.write(chunk.revealed + chunk.flagged)
+            chunk.dirty = False
+
+    def flush(self):
+        """Save every loaded chunk that changed."""
+        for chunk in self._chunks.values():
+            self._save(chunk)
+
+    def close(self):
+        """
+        Drop the loaded chunks and remove the temporary directory.
+
+        A directory passed to the constructor is kept, so call ``flush()``
+        first to save the loaded chunks there.
+        """
+        self._chunks.clear()
+        if self._owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _cell(self, x, y):
+        """Return (chunk, local index) for a world cell."""
+        size = self.chunk_size
+        cx, lx = divmod(x, size)
+        cy, ly = divmod(y, size)
+        return self.chunk_at(cx, cy), ly * size + lx
+
+    def count_at(self, x, y):
+        """Return the neighbour count of a cell, or MINE for a mine."""
+        chunk, index = self._cell(x, y)
+        return chunk.counts[index]
+
+    def is_revealed(self, x, y):
+        """Return True if the cell at (x, y) has been revealed."""
+        chunk, index = self._cell(x, y)
+        return chunk.revealed[index] == 1
+
+    def is_flagged(self, x, y):
+        """Return True if the cell at (x, y) is flagged."""
+        chunk, index = self._cell(x, y)
+        return chunk.flagged[index] == 1
+
+    def toggle_flag(self, x, y):
+        """
+        Flag a hidden cell, or remove its flag.
+
+        Args:
+            x (int): X-coordinate of the cell
+            y (int): Y-coordinate of the cell
+
+        Returns:
+            bool: True if the cell changed
+        """
+        chunk, index = self._cell(x, y)
+        if chunk.revealed[index]:
+            return False
+        chunk.flagged[index] ^= 1
+        chunk.dirty = True
+        return True
+
+    def reveal(self, x, y, limit=100_000):
+        """
+        Reveal a cell, flooding its open region across chunks.
+
+        A flood stops after ``limit`` cells so that one click cannot load
+        an unbounded number of chunks. Revealing an already revealed empty
+        cell resumes a flood that was cut short there.
+
+        Args:
+            x (int): X-coordinate of the cell
+            y (int): Y-coordinate of the cell
+            limit (int): Most cells to reveal (default 100,000)
+
+        Returns:
+            list: (x, y) of the newly revealed cells
+        """
+        chunk, index = self._cell(x, y)
+        if chunk.flagged[index]:
+            return []
+        if chunk.revealed[index]:
+            if chunk.counts[index]:
+                return []
+            queue = deque((x + dx, y + dy) for dx, dy in _OFFSETS)
+        elif chunk.counts[index] == MINE:
+            chunk.revealed[index] = 1
+            chunk.dirty = True
+            self.exploded = (x, y)
+            return [(x, y)]
+        else:
+            queue = deque([(x, y)])
+
+        newly = []
+        while queue and len(newly) < limit:
+            x, y = queue.popleft()
+            # Look the chunk up again every time: it may have been evicted
+            chunk, index = self._cell(x, y)
+            if chunk.revealed[index]:
+                continue
+            chunk.revealed[index] = 1
+            chunk.flagged[index] = 0  # Floods clear wrong flags
+            chunk.dirty = True
+            newly.append((x, y))
+            if chunk.counts[index] == 0:
+                queue.extend((x + dx, y + dy) for dx, dy in _OFFSETS)
+
+        self.revealed_count += len(newly)
+        return newly
+
+    def char_at(self, x, y):
+        """Return the character shown for the cell at (x, y)."""
+        chunk, index = self._cell(x, y)
+        if chunk.revealed[index]:
+            count = chunk.counts[index]
+            return "M" if count == MINE else chr(DIGITS[count])
+        return "F" if chunk.flagged[index] else "."
+
+    def fill_view(self, view, left, top, width, height):
+        """
+        Copy a window of the world into a view buffer.
+
+        Args:
+            view (bytearray): width * height characters, row by row
+            left (int): World x-coordinate of the window's first column
+            top (int): World y-coordinate of the window's first row
+            width (int): Width of the window
+            height (int): Height of the window
+        """
+        for y in range(height):
+            for x in range(width):
+                view[y * width + x] = ord(self.char_at(left + x, top + y))
+
+
+class Viewport:
+    """
+    A window onto a World, shaped like a game state for DiffRenderer.
+
+    Attributes:
+        world (World): The world shown
+        width (int): Width of the window
+        height (int): Height of the window
+        left (int): World x-coordinate of the first column
+        top (int): World y-coordinate of the first row
+        view (bytearray): The characters in the window
+    """
+
+    def __init__(self, world, width=30, height=16):
+        """
+        Initialize a window centred on the origin.
+
+        Args:
+            world (World): The world to show
+            width (int): Width of the window (default 30)
+            height (int): Height of the window (default 16)
+        """
+        self.world = world
+        self.width = width
+        self.height = height
+        self.left = -(width // 2)
+        self.top = -(height // 2)
+        self.view = bytearray([HIDDEN]) * (width * height)
+        self.refresh()
+
+    def refresh(self):
+        """Reread every cell of the window from the world."""
+        self.world.fill_view(self.view, self.left, self.top, self.width,
+                             self.height)
+
+    def update(self, cells):
+        """
+        Reread the given world cells that are inside the window.
+
+        Args:
+            cells (iterable): (x, y) world coordinates
+
+        Returns:
+            list: Flat view indices of the cells inside the window
+        """
+        changed = []
+        for x, y in cells:
+            vx, vy = x - self.left, y - self.top
+            if 0 <= vx < self.width and 0 <= vy < self.height:
+                index = vy * self.width + vx
+                self.view[index] = ord(self.world.char_at(x, y))
+                changed.append(index)
+        return changed
+
+    def scroll(self, dx, dy):
+        """Move the window by (dx, dy) cells."""
+        self.left += dx
+        self.top += dy
+        self.refresh()
+
+
+def play_endless(seed=0, width=30, height=16):
+    """
+    Game loop for the endless mode.
+
+    Args:
+        seed (int): Seed of the world (default 0)
+        width (int): Width of the window (default 30)
+        height (int): Height of the window (default 16)
+    """
+    world = World(seed)
+    window = Viewport(world, width, height)
+    step = max(width, height) // 2
+    moves = {'w': (0, -step), 'a': (-step, 0), 's': (0, step), 'd': (step, 0)}
+    renderer = DiffRenderer()
+    changed = None
+
+    while world.exploded is None:
+        if changed is None:
+            renderer.header = [
+                f"MINESWEEPER - ENDLESS - seed {seed}",
+                f"A1 is world cell ({window.left}, {window.top}); "
+                "(0, 0) is always safe",
+                "Type: A1 (reveal) | f A1 (flag) | w/a/s/d (scroll) | q (quit)",
+            ]
+        renderer.draw(window, changed, f"Revealed: {world.revealed_count}")
+        changed = []
+
+        move = input("> ").lower().strip()
+        if move == 'q':
+            break
+        if move in moves:
+            window.scroll(*moves[move])
+            changed = None
+            continue
+
+        # Commands are "A1" (reveal) and "f A1" (flag), in window coordinates
+        command, _, target = move.partition(" ")
+        if not target:
+            command, target = "", command
+        coords = parse_coordinates(target.strip(), width, height)
+        if not coords or command not in ("", "f"):
+            continue
+
+        x, y = window.left + coords[0], window.top + coords[1]
+        if command == "f":
+            world.toggle_flag(x, y)
+            changed = window.update([(x, y)])
+        else:
+            changed = window.update(world.reveal(x, y))
+
+    renderer.draw(window, changed,
+                  f"Game over! {world.revealed_count} cells revealed.")
+    world.flush()
+    world.close()
+
+
+if __name__ == "__main__":
+    play_endless(int(sys.argv[1]) if len(sys.argv) > 1 else 0)
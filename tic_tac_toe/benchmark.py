@@ -0,0 +1,82 @@
+"""
+Tic Tac Toe Board Benchmark
+
+Compares the nested-list ``Board`` with the bit-packed ``BitBoard`` by
+replaying the same random self-play games on both representations.
+
+Usage:
+    $ python tic_tac_toe/benchmark.py [n_games]
+"""
+
+import random
+import sys
+import time
+
+from player import BitBoard, Board
+
+
+def generate_games(n_games, seed=0):
+    """
+    Generate random move orders for self-play games.
+
+    Args:
+        n_games (int): Number of games to generate
+        seed (int): Seed for the random number generator
+
+    Returns:
+        list: One shuffled list of (row, col) tuples per game
+    """
+    rng = random.Random(seed)
+    cells = [(row, col) for row in range(3) for col in range(3)]
+    games = []
+    for _ in range(n_games):
+        order = cells[:]
+        rng.shuffle(order)
+        games.append(order)
+    return games
+
+
+def replay(board_class, games):
+    """
+    Play every game to completion on a fresh board.
+
+    Args:
+        board_class (type): ``Board`` or ``BitBoard``
+        games (list): Move orders produced by ``generate_games``
+
+    Returns:
+        tuple: (elapsed seconds, number of games won by either player)
+    """
+    wins = 0
+    start = time.perf_counter()
+    for moves in games:
+        board = board_class()
+        symbol = 'X'
+        for row, col in moves:
+            board.make_move(row, col, symbol)
+            if board.check_winner():
+                wins += 1
+                break
+            if board.is_full():
+                break
+            symbol = 'O' if symbol == 'X' else 'X'
+    return time.perf_counter() - start, wins
+
+
+def main():
+    """Run the benchmark and print a short comparison."""
+    n_games = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    games = generate_games(n_games)
+
+    results = {}
+    for board_class in (Board, BitBoard):
+        elapsed, wins = replay(board_class, games)
+        results[board_class.__name__] = elapsed
+        print(f"{board_class.__name__:>8}: {elapsed:.3f}s "
+              f"({n_games / elapsed:,.0f} games/s, {wins} decisive)")
+
+    print(f"Speedup: {results['Board'] / results['BitBoard']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Tic Tac Toe Input and Output
+
+Game and Player never call print or input directly; they talk to a
+renderer and an input source instead, so the same game loop can serve
+interactive play and high-volume automated runs.
+
+Classes:
+    NullRenderer: Discards all output, for batch runs
+    BufferedRenderer: Writes each board frame to a stream in one call
+    ConsoleInput: Reads moves from the keyboard
+    ScriptedInput: Replays moves from a list or a file
+"""
+
+import sys
+
+
+class NullRenderer:
+    """A renderer that ignores everything it is given."""
+
+    def show_board(self, board):
+        """Ignore a board frame."""
+
+    def show_message(self, text):
+        """Ignore a message."""
+
+
+class BufferedRenderer:
+    """
+    A renderer that writes each frame with a single write call.
+
+    The board is rendered to one string by ``board.render()`` instead of
+    printing cell by cell.
+
+    Attributes:
+        stream (file, optional): Where to write. Defaults to the current
+                                 ``sys.stdout`` at the time of writing
+    """
+
+    def __init__(self, stream=None):
+        """
+        Initialize the renderer.
+
+        Args:
+            stream (file, optional): Output stream, sys.stdout if omitted
+        """
+        self.stream = stream
+
+    def show_board(self, board):
+        """
+        Write the current board.
+
+        Args:
+            board (Board or BitBoard): The board to draw
+        """
+        (self.stream or sys.stdout).write(board.render())
+
+    def show_message(self, text):
+        """
+        Write a line of text.
+
+        Args:
+            text (str): The message to show
+        """
+        (self.stream or sys.stdout).write(text + "\n")
+
+
+class ConsoleInput:
+    """An input source that prompts the user on the terminal."""
+
+    def read(self, prompt):
+        """
+        Read one line from the user.
+
+        Args:
+            prompt (str): Text shown before the cursor
+
+        Returns:
+            str: The line entered by the user
+        """
+        return input(prompt)
+
+
+class ScriptedInput:
+    """
+    An input source that replays a fixed list of lines.
+
+    Attributes:
+        lines (list): The lines to replay, in order
+        position (int): Index of the next line to return
+    """
+
+    def __init__(self, lines):
+        """
+        Initialize the source.
+
+        Args:
+            lines (iterable): Lines to return, e.g. ["1,1", "0,2"]
+        """
+        self.lines = list(lines)
+        self.position = 0
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Load lines from a text file, one move per line.
+
+        Args:
+            path (str): Path of the file to replay
+
+        Returns:
+            ScriptedInput: A source replaying the file's non-empty lines
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls(line.strip() for line in file if line.strip())
+
+    def read(self, prompt):
+        """
+        Return the next scripted line.
+
+        Args:
+            prompt (str): Ignored, kept for compatibility with ConsoleInput
+
+        Returns:
+            str: The next line
+
+        Raises:
+            EOFError: If every line has already been read, like ``input``
+        """
+        if self.position >= len(self.lines):
+            raise EOFError("Scripted input is exhausted")
+        line = self.lines[self.position]
+        self.position += 1
+        return line
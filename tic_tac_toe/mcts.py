@@ -0,0 +1,315 @@
+"""
+Monte Carlo Tree Search Player for Tic Tac Toe
+
+Classes:
+    Node: One position in the search tree
+    MCTSPlayer: An anytime player using UCT with random rollouts
+
+Unlike MinimaxPlayer, the search does not need to see the whole game tree,
+so it also plays on larger boards such as ``Board(15, 15, 5)``. Each move
+is searched for a fixed number of iterations or a wall-clock budget,
+whichever runs out first, which caps the player's latency.
+
+Usage:
+    Play against the computer on a 7x7 board with 4 in a row:
+    $ python tic_tac_toe/mcts.py
+"""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from player import Board, Game, Player
+
+
+class Node:
+    """
+    A position in the search tree.
+
+    Attributes:
+        move (tuple): The (row, col) move that led here, None for the root
+        parent (Node): The previous position, None for the root
+        just_moved (str): Symbol of the player who made ``move``
+        children (dict): Maps (row, col) moves to expanded child nodes
+        untried (list): Legal moves that have no child node yet
+        visits (int): Number of rollouts through this node
+        wins (float): Rollout wins for ``just_moved``, draws count half
+    """
+
+    __slots__ = ('move', 'parent', 'just_moved', 'children', 'untried',
+                 'visits', 'wins')
+
+    def __init__(self, move, parent, just_moved, untried):
+        """Initialize an unvisited node."""
+        self.move = move
+        self.parent = parent
+        self.just_moved = just_moved
+        self.children = {}
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+
+def _legal_moves(board):
+    """Return the moves left on the board, or none if the game is over."""
+    if board.check_winner() or board.is_full():
+        return []
+    return board.available_moves()
+
+
+def _run_search(root, board, symbols, iterations, time_limit, exploration, rng):
+    """
+    Grow the tree under ``root`` until the budget runs out.
+
+    At least one iteration is always run, so a non-terminal root ends up
+    with at least one child.
+
+    Args:
+        root (Node): The node for ``board``
+        board (Board or BitBoard): The position to search from (not modified)
+        symbols (dict): Maps each symbol to its opponent's symbol
+        iterations (int or None): Maximum number of rollouts
+        time_limit (float or None): Maximum number of seconds
+        exploration (float): UCT exploration constant
+        rng (random.Random): Random generator for expansion and rollouts
+    """
+    deadline = (time.perf_counter() + time_limit
+                if time_limit is not None else None)
+    done = 0
+
+    # Every iteration plays on the same copy and takes its moves back
+    state = board.copy()
+    base = state.moves_made
+    while True:
+        # The first iteration always runs, so the root has a child to pick
+        # even when the budget is used up before the search starts
+        if done and iterations is not None and done >= iterations:
+            break
+        if done and deadline is not None and time.perf_counter() >= deadline:
+            break
+        done += 1
+
+        node = root
+
+        # Selection: descend through fully expanded nodes
+        while not node.untried and node.children:
+            log_visits = math.log(node.visits)
+            node = max(
+                node.children.values(),
+                key=lambda child: child.wins / child.visits + exploration *
+                math.sqrt(log_visits / child.visits))
+            state.make_move(*node.move, node.just_moved)
+
+        # Expansion: add one child for an untried move
+        if node.untried:
+            index = rng.randrange(len(node.untried))
+            node.untried[index], node.untried[-1] = (
+                node.untried[-1], node.untried[index])
+            move = node.untried.pop()
+            symbol = symbols[node.just_moved]
+            state.make_move(*move, symbol)
+            child = Node(move, node, symbol, _legal_moves(state))
+            node.children[move] = child
+            node = child
+
+        # Simulation: play random moves until the game ends
+        winner = state.check_winner()
+        if winner is None and not state.is_full():
+            moves = state.available_moves()
+            rng.shuffle(moves)
+            symbol = symbols[node.just_moved]
+            for row, col in moves:
+                state.make_move(row, col, symbol)
+                if state.check_winner():
+                    winner = symbol
+                    break
+                symbol = symbols[symbol]
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.just_moved:
+                node.wins += 1.0
+            node = node.parent
+
+        while state.moves_made > base:
+            state.unmake_move()
+
+
+def _root_parallel_search(args):
+    """
+    Search a fresh tree inside a worker process.
+
+    Args:
+        args (tuple): (board, symbol, iterations, time_limit, exploration, seed)
+
+    Returns:
+        dict: Maps (row, col) moves at the root to their visit counts
+    """
+    board, symbol, iterations, time_limit, exploration, seed = args
+    symbols = _symbol_pairs(symbol)
+    root = Node(None, None, symbols[symbol], _legal_moves(board))
+    _run_search(root, board, symbols, iterations, time_limit, exploration,
+                random.Random(seed))
+    return {move: child.visits for move, child in root.children.items()}
+
+
+def _symbol_pairs(symbol):
+    """Map each player's symbol to the other one's."""
+    opponent = 'O' if symbol == 'X' else 'X'
+    return {symbol: opponent, opponent: symbol}
+
+
+class MCTSPlayer(Player):
+    """
+    Represents a computer player using Monte Carlo Tree Search (UCT).
+
+    The tree is kept between turns: once the opponent has replied, the
+    subtree for their move becomes the new root, so earlier rollouts are
+    not thrown away. With ``workers`` above 1 the player instead runs
+    independent searches in a process pool and adds up the root visit
+    counts (root parallelization); trees are not reused in that mode.
+
+    Attributes:
+        iterations (int or None): Rollouts per move
+        time_limit (float or None): Seconds per move
+        exploration (float): UCT exploration constant
+        workers (int): Number of processes used for root-parallel search
+        rng (random.Random): Random generator for the search
+    """
+
+    def __init__(self, symbol, name=None, iterations=None, time_limit=1.0,
+                 exploration=math.sqrt(2), workers=1, seed=None):
+        """
+        Initialize the player.
+
+        Args:
+            symbol (str): The player's symbol ('X' or 'O')
+            name (str, optional): The player's name
+            iterations (int, optional): Rollouts per move
+            time_limit (float, optional): Seconds per move (default 1.0).
+                                          When both budgets are set the
+                                          search stops at the first one
+            exploration (float): UCT exploration constant (default sqrt(2))
+            workers (int): Processes for root-parallel search (default 1)
+            seed (int, optional): Seed for reproducible searches
+        """
+        super().__init__(symbol, name)
+        if iterations is None and time_limit is None:
+            raise ValueError("Set iterations, time_limit or both")
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.workers = workers
+        self.rng = random.Random(seed)
+        self._symbols = _symbol_pairs(symbol)
+        self._root = None
+        self._root_occupied = None
+        self._pool = None
+
+    def get_move(self, board):
+        """
+        Search the current position and return the most visited move.
+
+        Args:
+            board (Board or BitBoard): The current game board
+
+        Returns:
+            tuple: (row, col) coordinates for the player's move
+        """
+        if not _legal_moves(board):
+            raise ValueError("No moves left on the board")
+        if self.workers > 1:
+            return self._parallel_move(board)
+
+        occupied = self._occupied(board)
+        root = self._reuse_root(occupied)
+        if root is None:
+            root = Node(None, None, self._symbols[self.symbol],
+                        _legal_moves(board))
+
+        _run_search(root, board, self._symbols, self.iterations,
+                    self.time_limit, self.exploration, self.rng)
+
+        move = max(root.children.values(), key=lambda child: child.visits).move
+
+        # Keep our chosen subtree for the next turn
+        self._root = root.children[move]
+        self._root.parent = None
+        self._root_occupied = occupied | {move}
+        return move
+
+    def _occupied(self, board):
+        """Return the set of occupied (row, col) cells."""
+        return {(row, col)
+                for row, cells in enumerate(board.cells)
+                for col, cell in enumerate(cells)
+                if cell is not None}
+
+    def _reuse_root(self, occupied):
+        """
+        Find the subtree for the opponent's last move, if we have it.
+
+        Args:
+            occupied (set): Occupied cells on the current board
+
+        Returns:
+            Node or None: The new root, or None if the tree cannot be reused
+        """
+        if self._root is None:
+            return None
+        previous = self._root_occupied
+        if len(occupied) != len(previous) + 1 or not previous <= occupied:
+            return None  # A new game, or more than one move happened
+
+        (move,) = occupied - previous
+        root = self._root.children.get(move)
+        if root is not None:
+            root.parent = None
+        return root
+
+    def _parallel_move(self, board):
+        """
+        Run one independent search per worker and merge the root visits.
+
+        Args:
+            board (Board or BitBoard): The current game board
+
+        Returns:
+            tuple: (row, col) of the move with the most combined visits
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        iterations = None
+        if self.iterations is not None:
+            iterations = -(-self.iterations // self.workers)  # Ceiling
+        tasks = [(board, self.symbol, iterations, self.time_limit,
+                  self.exploration, self.rng.getrandbits(64))
+                 for _ in range(self.workers)]
+
+        totals = {}
+        for visits in self._pool.map(_root_parallel_search, tasks):
+            for move, count in visits.items():
+                totals[move] = totals.get(move, 0) + count
+        return max(totals, key=totals.get)
+
+    def close(self):
+        """Shut down the worker pool used for root-parallel search."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+def main():
+    """Play one game against the computer on a 7x7 board, 4 in a row."""
+    game = Game(Board(7, 7, 4))
+    game.players[1] = MCTSPlayer('O', name="Computer", time_limit=2.0)
+    game.play()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Minimax AI Player for Tic Tac Toe
+
+Classes:
+    MinimaxPlayer: A perfect player using negamax with alpha-beta pruning
+
+The search works on a pair of 9-bit masks (the side to move and its
+opponent), using the same bit layout as ``BitBoard``. Results are stored in
+a transposition table shared by every ``MinimaxPlayer``, keyed on a
+canonical hash that collapses the 8 rotations and reflections of the board,
+so the whole game tree only has to be solved once per process.
+
+Usage:
+    Play against the computer:
+    $ python tic_tac_toe/minimax.py
+"""
+
+from player import FULL_MASK, WINNING, BitBoard, Game, Player
+
+
+def _build_symmetries():
+    """
+    Build lookup tables mapping every 9-bit mask to its 8 symmetric images.
+
+    Returns:
+        tuple: 8 tuples of 512 permuted masks, identity first
+    """
+    transforms = [
+        lambda r, c: (r, c),          # Identity
+        lambda r, c: (c, 2 - r),      # Rotate 90
+        lambda r, c: (2 - r, 2 - c),  # Rotate 180
+        lambda r, c: (2 - c, r),      # Rotate 270
+        lambda r, c: (r, 2 - c),      # Mirror left-right
+        lambda r, c: (2 - r, c),      # Mirror top-bottom
+        lambda r, c: (c, r),          # Main diagonal
+        lambda r, c: (2 - c, 2 - r),  # Anti-diagonal
+    ]
+    tables = []
+    for transform in transforms:
+        # Where each source bit lands after the transform
+        targets = []
+        for index in range(9):
+            row, col = transform(index // 3, index % 3)
+            targets.append(row * 3 + col)
+
+        table = []
+        for mask in range(1 << 9):
+            image = 0
+            for index in range(9):
+                if mask >> index & 1:
+                    image |= 1 << targets[index]
+            table.append(image)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+SYMMETRIES = _build_symmetries()
+
+# Scores are from the point of view of the side to move. A win is worth
+# more the fewer stones it took, so the player prefers quick wins and
+# slow losses.
+MAX_SCORE = 10
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def canonical_key(me, opp):
+    """
+    Compute a hash shared by all 8 symmetric variants of a position.
+
+    Args:
+        me (int): 9-bit mask of the side to move
+        opp (int): 9-bit mask of the opponent
+
+    Returns:
+        int: The smallest 18-bit encoding among the symmetric variants
+    """
+    return min(table[me] | table[opp] << 9 for table in SYMMETRIES)
+
+
+class MinimaxPlayer(Player):
+    """
+    Represents a computer player that never loses.
+
+    Moves are chosen with negamax search and alpha-beta pruning. Every
+    position searched is stored in the class-wide ``transpositions`` table,
+    so after ``solve`` has been called (or a few games have been played)
+    choosing a move only needs one table lookup per empty cell.
+
+    Attributes:
+        transpositions (dict): Maps canonical keys to (flag, score) pairs,
+                               shared by all instances
+    """
+
+    transpositions = {}
+
+    def get_move(self, board):
+        """
+        Choose the best move for the current position.
+
+        Args:
+            board (Board or BitBoard): The current 3x3 game board
+
+        Returns:
+            tuple: (row, col) coordinates for the player's move
+        """
+        me, opp = self._masks(board)
+        best_score = best_index = None
+
+        for index in range(9):
+            bit = 1 << index
+            if (me | opp) & bit:
+                continue
+
+            # Score the child from our point of view
+            score = -self.search(opp, me | bit, -MAX_SCORE, MAX_SCORE)
+            if best_score is None or score > best_score:
+                best_score, best_index = score, index
+
+        if best_index is None:
+            raise ValueError("No moves left on the board")
+        return divmod(best_index, 3)
+
+    def _masks(self, board):
+        """
+        Convert a board into (own mask, opponent mask).
+
+        Args:
+            board (Board or BitBoard): A 3x3 game board
+
+        Returns:
+            tuple: (me, opp) 9-bit masks
+        """
+        if (board.width, board.height, board.win_length) != (3, 3, 3):
+            raise ValueError("MinimaxPlayer only plays the classic 3x3 game")
+
+        if isinstance(board, BitBoard):
+            me = board.bits.get(self.symbol, 0)
+            return me, board.occupied & ~me
+
+        me = opp = 0
+        for row in range(3):
+            for col in range(3):
+                cell = board.cells[row][col]
+                if cell is None:
+                    continue
+                if cell == self.symbol:
+                    me |= 1 << (row * 3 + col)
+                else:
+                    opp |= 1 << (row * 3 + col)
+        return me, opp
+
+    @classmethod
+    def search(cls, me, opp, alpha, beta):
+        """
+        Score a position with negamax and alpha-beta pruning.
+
+        Args:
+            me (int): 9-bit mask of the side to move
+            opp (int): 9-bit mask of the side that just moved
+            alpha (int): Lower bound of the search window
+            beta (int): Upper bound of the search window
+
+        Returns:
+            int: The score of the position for the side to move
+        """
+        occupied = me | opp
+        if WINNING[opp]:
+            return -(MAX_SCORE - occupied.bit_count())
+        if occupied == FULL_MASK:
+            return 0
+
+        key = canonical_key(me, opp)
+        entry = cls.transpositions.get(key)
+        if entry is not None:
+            flag, score = entry
+            # Bounds from earlier narrow-window searches are only reused
+            # when they already decide this window
+            if (flag == EXACT
+                    or flag == LOWER and score >= beta
+                    or flag == UPPER and score <= alpha):
+                return score
+
+        original_alpha = alpha
+        best = -MAX_SCORE
+        for index in range(9):
+            bit = 1 << index
+            if occupied & bit:
+                continue
+            score = -cls.search(opp, me | bit, -beta, -alpha)
+            if score > best:
+                best = score
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break  # The opponent will avoid this line
+
+        if best <= original_alpha:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        cls.transpositions[key] = (flag, best)
+        return best
+
+    @classmethod
+    def solve(cls):
+        """
+        Solve every reachable position so later moves are table lookups.
+
+        Returns:
+            int: Number of canonical positions stored in the table
+        """
+        seen = set()
+        stack = [(0, 0)]
+        while stack:
+            me, opp = stack.pop()
+            key = canonical_key(me, opp)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            # A full-width search leaves an exact score in the table
+            cls.search(me, opp, -MAX_SCORE, MAX_SCORE)
+            occupied = me | opp
+            if WINNING[opp] or occupied == FULL_MASK:
+                continue
+            for index in range(9):
+                bit = 1 << index
+                if not occupied & bit:
+                    stack.append((opp, me | bit))
+        return len(cls.transpositions)
+
+
+def main():
+    """Play one game against the computer on a bitboard."""
+    MinimaxPlayer.solve()
+    game = Game(BitBoard())
+    game.players[1] = MinimaxPlayer('O', name="Computer")
+    game.play()
+
+
+if __name__ == "__main__":
+    main()
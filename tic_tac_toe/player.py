@@ -2,7 +2,9 @@
 Tic Tac Toe Game
 Classes:
     Board: Manages the game board state and logic
+    BitBoard: Bitboard implementation of the Board API for fast self-play
     Player: Represents a player in the game
+    RandomPlayer: A computer player that picks a random empty cell
     Game: Controls the game flow and coordinates players
 
 Usage:
@@ -10,33 +12,112 @@ Usage:
     $ python tic_tac_toe/player.py
 """
 
+import random
+
+from console import BufferedRenderer, ConsoleInput
+
+
+# Bit index of a cell is row * 3 + col, so bit 0 is the top-left corner
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # Rows
+    0b001001001, 0b010010010, 0b100100100,  # Columns
+    0b100010001, 0b001010100,               # Diagonals
+)
+FULL_MASK = 0b111111111
+
+# WINNING[bits] is True when the 9-bit mask contains a complete line
+WINNING = tuple(
+    any(bits & mask == mask for mask in WIN_MASKS) for bits in range(1 << 9)
+)
+
+_ZOBRIST_KEYS = {}
+
+
+def zobrist_keys(num_cells, symbol):
+    """
+    Get the Zobrist keys for one symbol on a board of the given size.
+
+    Keys are drawn from a generator seeded with the board size and symbol,
+    so equal positions hash equally across boards and processes.
+
+    Args:
+        num_cells (int): Number of cells on the board
+        symbol (str): Player symbol ('X' or 'O')
+
+    Returns:
+        tuple: One random 64-bit key per cell index
+    """
+    keys = _ZOBRIST_KEYS.get((num_cells, symbol))
+    if keys is None:
+        rng = random.Random(f"zobrist:{num_cells}:{symbol}")
+        keys = tuple(rng.getrandbits(64) for _ in range(num_cells))
+        _ZOBRIST_KEYS[num_cells, symbol] = keys
+    return keys
+
 
 class Board:
     """
     Represents the Tic Tac Toe game board.
     
-    The board is implemented as a 3x3 grid where each cell can be:
+    The board is a grid (3x3 by default) where each cell can be:
     - None: Empty cell
     - 'X': Cell marked by the first player
     - 'O': Cell marked by the second player
     
+    Larger Gomoku-style variants are played by passing a bigger size and
+    win length, e.g. ``Board(15, 15, 5)``. Wins are detected as moves are
+    made by looking only at the 4 lines through the placed symbol, so each
+    move costs O(win_length) however large the board is.
+    
+    Moves can be taken back with ``unmake_move`` and replayed with
+    ``redo_move``, so a search can explore children on one board in place
+    instead of copying it for every node.
+    
     Attributes:
-        cells (list): A 2D list representing the 3x3 game board
+        width (int): Number of columns
+        height (int): Number of rows
+        win_length (int): Number of symbols in a row needed to win
+        cells (list): A 2D list representing the game board
         moves_made (int): Counter for the number of moves made on the board
+        winner (str or None): Symbol of the player who completed a line
+        history (list): Cell indices (row * width + col) of the moves made
+        hash (int): Zobrist hash of the position, updated on every move
     """
     
-    def __init__(self):
-        """Initialize an empty 3x3 game board."""
-        self.cells = [[None for _ in range(3)] for _ in range(3)]
+    # Row and column steps for horizontal, vertical and both diagonal lines
+    DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+    def __init__(self, width=3, height=3, win_length=3):
+        """
+        Initialize an empty game board.
+
+        Args:
+            width (int): Number of columns (default 3)
+            height (int): Number of rows (default 3)
+            win_length (int): Symbols in a row needed to win (default 3)
+        """
+        if win_length > max(width, height):
+            raise ValueError("win_length does not fit on the board")
+
+        self.width = width
+        self.height = height
+        self.win_length = win_length
+        self.cells = [[None for _ in range(width)] for _ in range(height)]
         self.moves_made = 0
+        self.winner = None
+        self.history = []
+        self.hash = 0
+        self._winning_ply = 0  # Value of moves_made when winner was set
+        self._redo = []
+        self._zobrist = {}
     
     def make_move(self, row, col, symbol):
         """
         Place a symbol on the board at the specified position.
         
         Args:
-            row (int): Row index (0-2)
-            col (int): Column index (0-2)
+            row (int): Row index (0 to height - 1)
+            col (int): Column index (0 to width - 1)
             symbol (str): Player symbol ('X' or 'O')
             
         Returns:
@@ -44,76 +125,366 @@ class Board:
                  invalid or already occupied
         """
         # Validate coordinates are within board boundaries
-        if not (0 <= row < 3 and 0 <= col < 3):
+        if not (0 <= row < self.height and 0 <= col < self.width):
             return False
         
         # Check if the cell is already occupied
         if self.cells[row][col] is not None:
             return False
         
+        # A new move invalidates the moves that were undone
+        if self._redo:
+            self._redo.clear()
+        self._place(row, col, symbol)
+        return True
+
+    def _place(self, row, col, symbol):
+        """Place a symbol on an empty, valid cell and update the bookkeeping."""
+        index = row * self.width + col
+        keys = self._zobrist.get(symbol)
+        if keys is None:
+            keys = self._zobrist[symbol] = zobrist_keys(
+                self.width * self.height, symbol)
+
         # Place the symbol and increment the move counter
         self.cells[row][col] = symbol
         self.moves_made += 1
-        return True
+        self.history.append(index)
+        self.hash ^= keys[index]
+
+        # Only lines through the new symbol can have been completed
+        if self.winner is None and self._completes_line(row, col, symbol):
+            self.winner = symbol
+            self._winning_ply = self.moves_made
+
+    def unmake_move(self):
+        """
+        Take back the last move.
+
+        Returns:
+            tuple or None: (row, col) of the removed move, or None if no
+                           moves have been made
+        """
+        if not self.history:
+            return None
+
+        index = self.history.pop()
+        row, col = divmod(index, self.width)
+        symbol = self.cells[row][col]
+        self._redo.append((index, symbol))
+
+        if self.winner is not None and self._winning_ply == self.moves_made:
+            self.winner = None
+        self.cells[row][col] = None
+        self.moves_made -= 1
+        self.hash ^= self._zobrist[symbol][index]
+        return row, col
+
+    def redo_move(self):
+        """
+        Replay the last move taken back by ``unmake_move``.
+
+        Returns:
+            tuple or None: (row, col) of the replayed move, or None if
+                           there is nothing to redo
+        """
+        if not self._redo:
+            return None
+        index, symbol = self._redo.pop()
+        row, col = divmod(index, self.width)
+        self._place(row, col, symbol)
+        return row, col
+
+    def _completes_line(self, row, col, symbol):
+        """
+        Check whether the symbol at (row, col) is part of a winning line.
+
+        Args:
+            row (int): Row index of the placed symbol
+            col (int): Column index of the placed symbol
+            symbol (str): Player symbol ('X' or 'O')
+
+        Returns:
+            bool: True if win_length symbols line up through the cell
+        """
+        cells = self.cells
+        for d_row, d_col in self.DIRECTIONS:
+            count = 1
+            # Walk away from the new symbol in both directions
+            for sign in (1, -1):
+                r, c = row + d_row * sign, col + d_col * sign
+                while (0 <= r < self.height and 0 <= c < self.width and
+                       cells[r][c] == symbol):
+                    count += 1
+                    r += d_row * sign
+                    c += d_col * sign
+            if count >= self.win_length:
+                return True
+        return False
 
     def check_winner(self):
         """
         Check if there's a winner on the board.
         
-        Examines all possible winning combinations (rows, columns, and diagonals)
-        to determine if a player has won.
+        The winner is detected in ``make_move``, so this is a constant-time
+        lookup.
         
         Returns:
             str or None: The winning symbol ('X' or 'O') or None if no winner
         """
-        # Check rows
-        for row in self.cells:
-            if (row[0] is not None and row[0] == row[1] == row[2]):
-                return row[0]
-        
-        # Check columns
-        for col in range(3):
-            if (self.cells[0][col] is not None and
-                self.cells[0][col] == self.cells[1][col] == self.cells[2][col]):
-                return self.cells[0][col]
-            
-        # Check diagonals
-        if (self.cells[0][0] is not None and
-            self.cells[0][0] == self.cells[1][1] == self.cells[2][2]):
-            return self.cells[0][0]
-        
-        if (self.cells[0][2] is not None and
-            self.cells[0][2] == self.cells[1][1] == self.cells[2][0]):
-            return self.cells[0][2]
-        
-        return None
+        return self.winner
     
     def is_full(self):
         """
         Check if the board is full (a draw).
         
         Returns:
-            bool: True if all 9 cells are filled, False otherwise
+            bool: True if all cells are filled, False otherwise
         """
-        return self.moves_made == 9
+        return self.moves_made == self.width * self.height
     
-    def display(self):
+    def available_moves(self):
         """
-        Print the current state of the board to the console.
+        List the empty cells.
+
+        Returns:
+            list: (row, col) tuples for every unoccupied cell
+        """
+        return [(row, col)
+                for row in range(self.height)
+                for col in range(self.width)
+                if self.cells[row][col] is None]
+
+    def copy(self):
+        """
+        Create an independent copy of the board.
+
+        Returns:
+            Board: A board with the same size, cells and winner
+        """
+        board = Board.__new__(Board)
+        board.width = self.width
+        board.height = self.height
+        board.win_length = self.win_length
+        board.cells = [row[:] for row in self.cells]
+        board.moves_made = self.moves_made
+        board.winner = self.winner
+        board.history = self.history[:]
+        board.hash = self.hash
+        board._winning_ply = self._winning_ply
+        board._redo = self._redo[:]
+        board._zobrist = dict(self._zobrist)
+        return board
+
+    def render(self):
+        """
+        Render the board as a single string.
         
-        Displays the board with row and column indices for reference.
+        Shows the board with row and column indices for reference.
         Empty cells are shown as dots, and filled cells show the player symbol.
+        
+        Returns:
+            str: The board frame, ending with a blank line
         """
-        print("\n 0 1 2")  # Column indices
+        col_width = len(str(self.width - 1))
+        row_width = len(str(self.height - 1))
+
+        # Column indices
+        lines = ["", " " * row_width + " " + "".join(
+            f"{col:>{col_width}} " for col in range(self.width))]
+
         for i, row in enumerate(self.cells):
-            print(f"{i}", end=" ")  # Row index
-            for cell in row:
-                if cell is None:
-                    print(".", end=" ")  # Empty cell
-                else:
-                    print(cell, end=" ")  # Player symbol
-            print()  # New line after each row
-        print()  # Extra line after the board
+            lines.append(f"{i:>{row_width}} " + "".join(
+                f"{'.' if cell is None else cell:>{col_width}} " for cell in row))
+        lines.append("")  # Extra line after the board
+        return "\n".join(lines) + "\n"
+
+    def display(self):
+        """Print the current state of the board to the console."""
+        print(self.render(), end="")
+
+
+class BitBoard:
+    """
+    Represents the Tic Tac Toe game board as two 9-bit integers.
+
+    Each player owns one integer in which bit ``row * 3 + col`` is set when
+    that player has marked the cell. Checking for a winner is then a single
+    table lookup in ``WINNING``, which is built once from the 8 line masks
+    in ``WIN_MASKS``, instead of walking the nested ``cells`` list. The
+    public API matches ``Board``, so ``Game`` can run on either
+    representation, but it is always a classic 3x3 board.
+
+    Attributes:
+        bits (dict): Maps each player symbol to its 9-bit occupancy mask
+        occupied (int): Union of all player masks
+        moves_made (int): Counter for the number of moves made on the board
+        winner (str or None): Symbol of the player who completed a line
+        history (list): Cell indices (row * 3 + col) of the moves made
+        hash (int): Zobrist hash of the position, equal to a Board's hash
+                    for the same 3x3 position
+    """
+
+    width = height = win_length = 3
+
+    def __init__(self):
+        """Initialize an empty 3x3 bitboard."""
+        self.bits = {}
+        self.occupied = 0
+        self.moves_made = 0
+        self.winner = None
+        self.history = []
+        self.hash = 0
+        self._winning_ply = 0
+        self._redo = []
+
+    def make_move(self, row, col, symbol):
+        """
+        Place a symbol on the board at the specified position.
+
+        Args:
+            row (int): Row index (0-2)
+            col (int): Column index (0-2)
+            symbol (str): Player symbol ('X' or 'O')
+
+        Returns:
+            bool: True if the move was successful, False if the position is
+                 invalid or already occupied
+        """
+        if not (0 <= row < 3 and 0 <= col < 3):
+            return False
+
+        index = row * 3 + col
+        if self.occupied >> index & 1:
+            return False
+
+        if self._redo:
+            self._redo.clear()
+        self._place(index, symbol)
+        return True
+
+    def _place(self, index, symbol):
+        """Mark an empty cell and update the bookkeeping."""
+        bit = 1 << index
+        bits = self.bits.get(symbol, 0) | bit
+        self.bits[symbol] = bits
+        self.occupied |= bit
+        self.moves_made += 1
+        self.history.append(index)
+        self.hash ^= zobrist_keys(9, symbol)[index]
+
+        # Only the player who just moved can have completed a line
+        if self.winner is None and WINNING[bits]:
+            self.winner = symbol
+            self._winning_ply = self.moves_made
+
+    def unmake_move(self):
+        """
+        Take back the last move.
+
+        Returns:
+            tuple or None: (row, col) of the removed move, or None if no
+                           moves have been made
+        """
+        if not self.history:
+            return None
+
+        index = self.history.pop()
+        bit = 1 << index
+        for symbol, bits in self.bits.items():
+            if bits & bit:
+                break
+        self._redo.append((index, symbol))
+
+        if self.winner is not None and self._winning_ply == self.moves_made:
+            self.winner = None
+        self.bits[symbol] = bits & ~bit
+        self.occupied &= ~bit
+        self.moves_made -= 1
+        self.hash ^= zobrist_keys(9, symbol)[index]
+        return divmod(index, 3)
+
+    def redo_move(self):
+        """
+        Replay the last move taken back by ``unmake_move``.
+
+        Returns:
+            tuple or None: (row, col) of the replayed move, or None if
+                           there is nothing to redo
+        """
+        if not self._redo:
+            return None
+        index, symbol = self._redo.pop()
+        self._place(index, symbol)
+        return divmod(index, 3)
+
+    def check_winner(self):
+        """
+        Check if there's a winner on the board.
+
+        The winner is detected in ``make_move``, so this is a constant-time
+        lookup.
+
+        Returns:
+            str or None: The winning symbol ('X' or 'O') or None if no winner
+        """
+        return self.winner
+
+    def is_full(self):
+        """
+        Check if the board is full (a draw).
+
+        Returns:
+            bool: True if all 9 cells are filled, False otherwise
+        """
+        return self.occupied == FULL_MASK
+
+    def available_moves(self):
+        """
+        List the empty cells.
+
+        Returns:
+            list: (row, col) tuples for every unoccupied cell
+        """
+        return [divmod(index, 3) for index in range(9)
+                if not self.occupied >> index & 1]
+
+    def copy(self):
+        """
+        Create an independent copy of the board.
+
+        Returns:
+            BitBoard: A bitboard with the same masks and winner
+        """
+        board = BitBoard.__new__(BitBoard)
+        board.bits = dict(self.bits)
+        board.occupied = self.occupied
+        board.moves_made = self.moves_made
+        board.winner = self.winner
+        board.history = self.history[:]
+        board.hash = self.hash
+        board._winning_ply = self._winning_ply
+        board._redo = self._redo[:]
+        return board
+
+    @property
+    def cells(self):
+        """
+        Build the nested list view used by ``Board``.
+
+        Returns:
+            list: A 2D list of None or player symbols
+        """
+        cells = [[None for _ in range(3)] for _ in range(3)]
+        for symbol, bits in self.bits.items():
+            for index in range(9):
+                if bits >> index & 1:
+                    cells[index // 3][index % 3] = symbol
+        return cells
+
+    # The nested ``cells`` view lets the bitboard share Board's rendering
+    render = Board.render
+    display = Board.display
 
 
 class Player:
@@ -123,9 +494,13 @@ class Player:
     Attributes:
         symbol (str): The player's symbol ('X' or 'O')
         name (str): The player's name
+        input_source: Where moves are read from (a ConsoleInput is
+                      created on first use if none was given)
+        renderer: Where input errors are reported (the Game's renderer,
+                  or a BufferedRenderer created on first use)
     """
     
-    def __init__(self, symbol, name=None):
+    def __init__(self, symbol, name=None, input_source=None, renderer=None):
         """
         Initialize a player with a symbol and optional name.
         
@@ -133,9 +508,15 @@ class Player:
             symbol (str): The player's symbol ('X' or 'O')
             name (str, optional): The player's name. If not provided,
                                  defaults to "Player X" or "Player O"
+            input_source (optional): Object with a ``read(prompt)`` method,
+                                     e.g. ScriptedInput for automated runs
+            renderer (optional): Object with a ``show_message(text)`` method
         """
         self.symbol = symbol
         self.name = name if name else f"Player {symbol}"
+        # Created lazily, so computer players never allocate console objects
+        self.input_source = input_source
+        self.renderer = renderer
     
     def get_move(self, board):
         """
@@ -151,13 +532,40 @@ class Player:
         Returns:
             tuple: (row, col) coordinates for the player's move
         """
+        if self.input_source is None:
+            self.input_source = ConsoleInput()
         while True:
             try:
-                move = input(f"{self.name}'s turn ({self.symbol}). Enter row,col: ")
+                move = self.input_source.read(
+                    f"{self.name}'s turn ({self.symbol}). Enter row,col: ")
                 row, col = map(int, move.split(","))
                 return row, col
             except ValueError:
-                print("Invalid input. Please enter row,col (e.g. 0,2)")
+                if self.renderer is None:
+                    self.renderer = BufferedRenderer()
+                self.renderer.show_message(
+                    "Invalid input. Please enter row,col (e.g. 0,2)")
+
+
+class RandomPlayer(Player):
+    """
+    Represents a computer player that moves to a random empty cell.
+
+    Uses the module-level ``random`` generator, so seeding ``random`` makes
+    its games reproducible.
+    """
+
+    def get_move(self, board):
+        """
+        Pick a random empty cell.
+
+        Args:
+            board (Board or BitBoard): The current game board
+
+        Returns:
+            tuple: (row, col) coordinates for the player's move
+        """
+        return random.choice(board.available_moves())
 
 
 class Game:
@@ -168,18 +576,36 @@ class Game:
     the game ends and who wins.
     
     Attributes:
-        board (Board): The game board
+        board (Board or BitBoard): The game board
         players (list): List containing two Player objects
+        renderer: Where the board and messages are shown
         current_player_idx (int): Index of the current player (0 or 1)
     """
     
-    def __init__(self):
-        """Initialize a new game with a board and two players."""
-        self.board = Board()
-        self.players = [
+    def __init__(self, board=None, players=None, renderer=None):
+        """
+        Initialize a new game with a board and two players.
+
+        Args:
+            board (Board or BitBoard, optional): The board to play on.
+                                                Defaults to a new ``Board``
+            players (list, optional): Two Player objects. Defaults to two
+                                      console players, X and O
+            renderer (optional): Object with ``show_board(board)`` and
+                                 ``show_message(text)`` methods. Defaults to
+                                 a BufferedRenderer on stdout; pass a
+                                 NullRenderer for batch runs
+        """
+        self.board = board if board is not None else Board()
+        self.players = players if players else [
             Player('X'),
             Player('O')
         ]
+        self.renderer = renderer if renderer else BufferedRenderer()
+        # Players without their own renderer report input errors through ours
+        for player in self.players:
+            if player.renderer is None:
+                player.renderer = self.renderer
         self.current_player_idx = 0  # Start with Player X
 
     def switch_player(self):
@@ -203,14 +629,18 @@ class Game:
         Controls the flow of the game, including displaying the board,
         getting player moves, checking for game end conditions, and
         switching between players.
+        
+        Returns:
+            Player or None: The winning player, or None for a draw
         """
-        print("Welcome to Tic Tac Toe!")
-        print("Enter moves as 'row,col' (e.g. 0,2 for top-right)")
+        renderer = self.renderer
+        renderer.show_message("Welcome to Tic Tac Toe!")
+        renderer.show_message("Enter moves as 'row,col' (e.g. 0,2 for top-right)")
 
         # Game loop
         while True:
             # Display the current state of the board
-            self.board.display()
+            renderer.show_board(self.board)
 
             # Get the current player's move
             player = self.current_player
@@ -218,21 +648,21 @@ class Game:
 
             # Make the move
             if not self.board.make_move(row, col, player.symbol):
-                print("Invalid move. Try again.")
+                renderer.show_message("Invalid move. Try again.")
                 continue
 
             # Check for win
             winner = self.board.check_winner()
             if winner:
-                self.board.display()
-                print(f"{player.name} wins!")
-                break
+                renderer.show_board(self.board)
+                renderer.show_message(f"{player.name} wins!")
+                return player
 
             # Check for draw
             if self.board.is_full():
-                self.board.display()
-                print("It's a draw!")
-                break
+                renderer.show_board(self.board)
+                renderer.show_message("It's a draw!")
+                return None
             
             # Switch player for next turn
             self.switch_player()
@@ -0,0 +1,226 @@
+"""
+Headless Tic Tac Toe Simulator
+
+Plays large numbers of bot-vs-bot games without any console I/O and
+aggregates the results. Games are split into chunks that run in a process
+pool; each chunk seeds ``random`` from the base seed and its own index, so
+results are reproducible whatever the number of workers. The caller's
+``random`` state is restored after each chunk, so running in-process does
+not disturb it.
+
+Functions:
+    play_headless: Play one game between two computer players
+    simulate: Play many games, optionally across several processes
+
+Usage:
+    $ python tic_tac_toe/simulate.py [n_games] [workers]
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from player import BitBoard, RandomPlayer
+
+SYMBOLS = ('X', 'O')
+
+
+def play_headless(board, players):
+    """
+    Play one game to completion without printing anything.
+
+    Args:
+        board (Board or BitBoard): An empty game board
+        players (list): Two Player objects, the first one moves first
+
+    Returns:
+        tuple: (index of the winning player or None for a draw,
+                list of (row, col) moves in the order they were played)
+
+    Raises:
+        ValueError: If a player returns an illegal move
+    """
+    moves = []
+    current = 0
+    while True:
+        player = players[current]
+        row, col = player.get_move(board)
+        if not board.make_move(row, col, player.symbol):
+            raise ValueError(f"{player.name} made an illegal move: {row},{col}")
+        moves.append((row, col))
+
+        if board.check_winner():
+            return current, moves
+        if board.is_full():
+            return None, moves
+        current = 1 - current
+
+
+def _empty_stats():
+    """Create the counters accumulated by every chunk."""
+    return {
+        'games': 0,
+        'wins': 0,
+        'draws': 0,
+        'losses': 0,
+        'length_histogram': {},
+        'move_counts': [],
+    }
+
+
+def chunk_seed(seed, index):
+    """
+    Derive the seed of one chunk.
+
+    The seed is hashed together with the chunk index, so different base
+    seeds do not share chunks the way ``seed + index`` would.
+
+    Args:
+        seed (int): Base seed of the simulation
+        index (int): Index of the chunk
+
+    Returns:
+        str: Seed for ``random.seed``
+    """
+    return f"{seed}:{index}"
+
+
+def _run_chunk(args):
+    """
+    Play one chunk of games inside a worker process.
+
+    Args:
+        args (tuple): (n_games, player_factories, board_factory, seed)
+
+    Returns:
+        dict: Counters for this chunk, in the format of ``_empty_stats``
+    """
+    n_games, player_factories, board_factory, seed = args
+    # Players draw from the module-level generator; restore it afterwards
+    # because with one worker this runs in the caller's process
+    saved = random.getstate()
+    random.seed(seed)
+    try:
+        return _play_chunk(n_games, player_factories, board_factory)
+    finally:
+        random.setstate(saved)
+
+
+def _play_chunk(n_games, player_factories, board_factory):
+    """Play the games of one chunk and count the results."""
+    stats = _empty_stats()
+    lengths = stats['length_histogram']
+    move_counts = stats['move_counts']
+
+    for _ in range(n_games):
+        board = board_factory()
+        players = [factory(symbol)
+                   for factory, symbol in zip(player_factories, SYMBOLS)]
+        winner, moves = play_headless(board, players)
+
+        if winner is None:
+            stats['draws'] += 1
+        elif winner == 0:
+            stats['wins'] += 1
+        else:
+            stats['losses'] += 1
+        lengths[len(moves)] = lengths.get(len(moves), 0) + 1
+
+        # How often each cell is chosen at each ply
+        for ply, (row, col) in enumerate(moves):
+            if ply == len(move_counts):
+                move_counts.append({})
+            counts = move_counts[ply]
+            counts[row, col] = counts.get((row, col), 0) + 1
+
+    stats['games'] = n_games
+    return stats
+
+
+def _merge(total, stats):
+    """Add the counters of one chunk into the running total."""
+    for key in ('games', 'wins', 'draws', 'losses'):
+        total[key] += stats[key]
+    for length, count in stats['length_histogram'].items():
+        total['length_histogram'][length] = (
+            total['length_histogram'].get(length, 0) + count)
+    for ply, counts in enumerate(stats['move_counts']):
+        if ply == len(total['move_counts']):
+            total['move_counts'].append({})
+        merged = total['move_counts'][ply]
+        for cell, count in counts.items():
+            merged[cell] = merged.get(cell, 0) + count
+
+
+def simulate(n_games, player_factories, workers=None, board_factory=BitBoard,
+             seed=0, chunk_size=10_000):
+    """
+    Play many headless games and aggregate the results.
+
+    Factories and the board factory are sent to worker processes, so they
+    must be picklable: classes, module-level functions or
+    ``functools.partial`` objects, not lambdas.
+
+    Args:
+        n_games (int): Number of games to play
+        player_factories (tuple): Two callables taking a symbol and
+                                  returning a Player; the first moves first
+        workers (int, optional): Number of processes. Defaults to the CPU
+                                 count; 1 runs everything in this process
+        board_factory (callable): Returns an empty board for each game
+        seed (int): Base seed; chunk i seeds ``random`` with
+                    ``chunk_seed(seed, i)``
+        chunk_size (int): Number of games handed to a worker at a time
+
+    Returns:
+        dict: 'games', 'wins', 'draws' and 'losses' (from the first
+              player's point of view), 'length_histogram' mapping game
+              length to count, 'mean_length', and 'move_counts', a list
+              with one {(row, col): count} dict per ply
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    tasks = []
+    remaining = n_games
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        tasks.append((size, tuple(player_factories), board_factory,
+                      chunk_seed(seed, len(tasks))))
+        remaining -= size
+
+    total = _empty_stats()
+    if workers == 1 or len(tasks) == 1:
+        for stats in map(_run_chunk, tasks):
+            _merge(total, stats)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for stats in pool.map(_run_chunk, tasks):
+                _merge(total, stats)
+
+    played_moves = sum(length * count
+                       for length, count in total['length_histogram'].items())
+    total['mean_length'] = played_moves / total['games'] if total['games'] else 0.0
+    return total
+
+
+def main():
+    """Run random-vs-random self-play and print a summary."""
+    n_games = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    start = time.perf_counter()
+    result = simulate(n_games, (RandomPlayer, RandomPlayer), workers=workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"{result['games']} games in {elapsed:.2f}s "
+          f"({result['games'] / elapsed:,.0f} games/s)")
+    print(f"X wins: {result['wins']}  draws: {result['draws']}  "
+          f"O wins: {result['losses']}")
+    print(f"Mean game length: {result['mean_length']:.2f} moves")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Tic Tac Toe Tablebase
+
+Precomputes the game-theoretic value and best move of every position
+reachable in a classic 3x3 game where X moves first (5,478 positions),
+stores them in a compact binary file and memory-maps the file on load, so
+answering any position is one array lookup with no parsing at start-up.
+
+File format (little-endian):
+    header:  4s magic b"TTTB", uint16 version, uint16 reserved,
+             uint32 number of entries (3 ** 9)
+    entries: one byte per position, indexed by the base-3 encoding of
+             the board (digit 0 empty, 1 X, 2 O; cell row * 3 + col is
+             the digit for 3 ** (row * 3 + col)).
+             0xFF marks unreachable positions; otherwise the low 2 bits
+             hold the result (DRAW, X_WINS or O_WINS) and the high 4 bits
+             the best move for the side to move (NO_MOVE when the game
+             is over).
+
+Classes:
+    Tablebase: Read-only view over a tablebase file
+    TablebasePlayer: A perfect player answering from the tablebase
+
+Usage:
+    Build the file next to this module:
+    $ python tic_tac_toe/tablebase.py build
+"""
+
+import mmap
+import os
+import struct
+import sys
+
+from player import FULL_MASK, WINNING, BitBoard, Player
+
+MAGIC = b"TTTB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+NUM_ENTRIES = 3 ** 9
+
+DRAW, X_WINS, O_WINS = 0, 1, 2
+NO_MOVE = 15
+UNREACHABLE = 0xFF
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "tablebase.bin")
+
+# TERNARY[mask] places a 1 digit on every set bit, so a board's index is
+# TERNARY[x_mask] + 2 * TERNARY[o_mask]
+TERNARY = tuple(
+    sum(3 ** index for index in range(9) if mask >> index & 1)
+    for mask in range(1 << 9)
+)
+
+
+def position_index(x_mask, o_mask):
+    """
+    Compute the tablebase index of a position.
+
+    Args:
+        x_mask (int): 9-bit mask of X's cells
+        o_mask (int): 9-bit mask of O's cells
+
+    Returns:
+        int: Index into the entry table
+    """
+    return TERNARY[x_mask] + 2 * TERNARY[o_mask]
+
+
+def generate():
+    """
+    Solve every reachable position.
+
+    Returns:
+        bytearray: NUM_ENTRIES entry bytes, in the on-disk layout
+    """
+    entries = bytearray([UNREACHABLE]) * NUM_ENTRIES
+    scores = {}
+
+    def solve(me, opp):
+        # Score for the side to move; faster wins score higher
+        key = (me, opp)
+        if key in scores:
+            return scores[key][0]
+
+        occupied = me | opp
+        best_score, best_move = None, NO_MOVE
+        if WINNING[opp]:
+            best_score = -(10 - occupied.bit_count())
+        elif occupied == FULL_MASK:
+            best_score = 0
+        else:
+            for index in range(9):
+                bit = 1 << index
+                if occupied & bit:
+                    continue
+                score = -solve(opp, me | bit)
+                if best_score is None or score > best_score:
+                    best_score, best_move = score, index
+
+        scores[key] = (best_score, best_move)
+        return best_score
+
+    solve(0, 0)
+
+    for (me, opp), (score, move) in scores.items():
+        # X is to move when both players have the same number of marks
+        x_to_move = me.bit_count() == opp.bit_count()
+        x_mask, o_mask = (me, opp) if x_to_move else (opp, me)
+        if score == 0:
+            result = DRAW
+        elif (score > 0) == x_to_move:
+            result = X_WINS
+        else:
+            result = O_WINS
+        entries[position_index(x_mask, o_mask)] = move << 4 | result
+    return entries
+
+
+def build(path=DEFAULT_PATH):
+    """
+    Generate the tablebase and write it to disk.
+
+    Args:
+        path (str): Destination file
+
+    Returns:
+        int: Number of reachable positions written
+    """
+    entries = generate()
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, NUM_ENTRIES))
+        file.write(entries)
+    return NUM_ENTRIES - entries.count(UNREACHABLE)
+
+
+class Tablebase:
+    """
+    Read-only, memory-mapped view over a tablebase file.
+
+    Attributes:
+        version (int): Format version read from the header
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        """
+        Map a tablebase file into memory.
+
+        Args:
+            path (str): File written by ``build``
+
+        Raises:
+            ValueError: If the file is not a tablebase of a known version
+        """
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a tablebase")
+        magic, version, _, count = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a tablebase file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported tablebase version {version}")
+        if count != NUM_ENTRIES or len(self._map) != HEADER.size + count:
+            raise ValueError(f"{path} is truncated or corrupt")
+
+        self.version = version
+        self._entries = memoryview(self._map)[HEADER.size:]
+
+    def lookup(self, x_mask, o_mask):
+        """
+        Look up a position.
+
+        Args:
+            x_mask (int): 9-bit mask of X's cells
+            o_mask (int): 9-bit mask of O's cells
+
+        Returns:
+            tuple: (result, best move index) where result is DRAW, X_WINS
+                   or O_WINS and the move is NO_MOVE if the game is over
+
+        Raises:
+            KeyError: If the position cannot arise in a game X starts
+        """
+        entry = self._entries[position_index(x_mask, o_mask)]
+        if entry == UNREACHABLE:
+            raise KeyError("Position is not reachable")
+        return entry & 0b11, entry >> 4
+
+    def close(self):
+        """Release the memory map."""
+        self._entries.release()
+        self._map.close()
+
+
+class TablebasePlayer(Player):
+    """
+    Represents a perfect computer player backed by a tablebase.
+
+    Positions are read with ``board.bits`` on a BitBoard or by scanning
+    ``cells`` on a 3x3 Board, so the marks must be 'X' and 'O' and X must
+    have moved first.
+
+    Attributes:
+        tablebase (Tablebase): The table answering each position
+    """
+
+    def __init__(self, symbol, name=None, tablebase=None):
+        """
+        Initialize the player.
+
+        Args:
+            symbol (str): The player's symbol ('X' or 'O')
+            name (str, optional): The player's name
+            tablebase (Tablebase, optional): A loaded tablebase. Defaults
+                                             to mapping DEFAULT_PATH
+        """
+        super().__init__(symbol, name)
+        self.tablebase = tablebase if tablebase else Tablebase()
+
+    def get_move(self, board):
+        """
+        Look up the best move for the current position.
+
+        Args:
+            board (Board or BitBoard): The current 3x3 game board
+
+        Returns:
+            tuple: (row, col) coordinates for the player's move
+        """
+        if (board.width, board.height, board.win_length) != (3, 3, 3):
+            raise ValueError("TablebasePlayer only plays the classic 3x3 game")
+
+        if isinstance(board, BitBoard):
+            x_mask = board.bits.get('X', 0)
+            o_mask = board.bits.get('O', 0)
+        else:
+            x_mask = o_mask = 0
+            for index in range(9):
+                cell = board.cells[index // 3][index % 3]
+                if cell == 'X':
+                    x_mask |= 1 << index
+                elif cell == 'O':
+                    o_mask |= 1 << index
+
+        _, move = self.tablebase.lookup(x_mask, o_mask)
+        if move == NO_MOVE:
+            raise ValueError("The game is already over")
+        return divmod(move, 3)
+
+
+def main():
+    """Build the tablebase from the command line."""
+    if len(sys.argv) < 2 or sys.argv[1] != "build":
+        print("Usage: python tablebase.py build [path]")
+        return
+    path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PATH
+    positions = build(path)
+    print(f"Wrote {positions} positions to {path}")
+
+
+if __name__ == "__main__":
+    main()